@@ -0,0 +1,35 @@
+"""Startup cost of the CLDR timezone aliases: the snapshot in ``assets/`` against parsing ``timezone.xml``.
+
+Run with ``python -m benchmarks.bench_cldr_startup [path/to/timezone.xml]``.
+Without a path only the snapshot is measured; the download that used to precede parsing is not included either way.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from bot.core.cldr import load_snapshot, parse_timezone_xml
+
+NUMBER = 200
+
+
+def main() -> None:
+    snapshot = load_snapshot()
+    if snapshot is None and len(sys.argv) < 2:
+        sys.exit("No snapshot in assets/, build one with `python -m bot.core.cldr` or pass a timezone.xml.")
+
+    if snapshot is not None:
+        total = timeit.timeit(load_snapshot, number=NUMBER)
+        print(f"{'load_snapshot':<20} {total / NUMBER * 1e3:8.3f} ms ({len(snapshot['aliases'])} aliases)")
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as file:
+            data = file.read()
+
+        total = timeit.timeit(lambda: parse_timezone_xml(data), number=NUMBER)
+        print(f"{'parse_timezone_xml':<20} {total / NUMBER * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Import-time budget report for every extension, in the spirit of ``python -X importtime``.
+
+Run with ``python -m benchmarks.bench_cog_imports``.
+
+Each extension is imported in a fresh interpreter after ``bot.core`` (which every cog needs anyway),
+so the numbers are what that extension adds on top: cumulative import time, the heaviest modules it
+pulls in, and the growth of the peak resident set size.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+from bot.core.bot import __all_cogs__, __lazy_cogs__
+
+# cogs over budget are flagged, not failed
+BUDGET_MS = 150
+TOP_MODULES = 5
+
+PROBE = """
+import importlib, resource, sys
+import bot.core
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+sys.stderr.write("--- bot.core imported\\n")
+importlib.import_module(sys.argv[1])
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(after - before)
+"""
+
+
+def probe(extension: str) -> tuple[float, list[tuple[float, str]], int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, extension], capture_output=True, text=True, check=True, env={**os.environ, "PYTHONWARNINGS": "ignore"}
+    )
+
+    _, _, lines = result.stderr.partition("--- bot.core imported\n")
+    modules: list[tuple[float, str]] = []
+    total = 0.0
+    for line in lines.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_us, cumulative_us, name = (part.strip() for part in line.removeprefix("import time:").split("|"))
+        if not self_us.isdigit():
+            continue
+
+        modules.append((int(self_us) / 1000, name.strip()))
+        if name.strip() == extension:
+            total = int(cumulative_us) / 1000
+
+    return total, sorted(modules, reverse=True)[:TOP_MODULES], int(result.stdout.strip() or 0)
+
+
+def main() -> None:
+    extensions = [*__all_cogs__, *(extension.name for extension in __lazy_cogs__)]
+    width = max(map(len, extensions))
+
+    print(f"{'extension':<{width}} {'import':>10} {'peak rss':>10}  heaviest modules (self time)")
+    for extension in extensions:
+        try:
+            total, heaviest, rss_kb = probe(extension)
+        except subprocess.CalledProcessError as e:
+            print(f"{extension:<{width}} {'failed':>10}  {e.stderr.strip().splitlines()[-1]}")
+            continue
+
+        flag = "  OVER BUDGET" if total > BUDGET_MS else ""
+        modules = ", ".join(f"{name} {ms:.1f}" for ms, name in heaviest)
+        print(f"{extension:<{width}} {total:8.1f}ms {rss_kb / 1024:8.1f}MB  {modules}{flag}")
+
+
+if __name__ == "__main__":
+    main()
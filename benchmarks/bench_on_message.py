@@ -0,0 +1,44 @@
+"""Microbenchmark for the non-command message fast path of ``Parrot.on_message``.
+
+Run with ``python -m benchmarks.bench_on_message``.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import timeit
+
+from bot.core.guild_settings import GuildSettingsStore
+
+GUILDS = 10_000
+NUMBER = 1_000_000
+
+CHAT_MESSAGES = ["hello there", "lol", "did anyone see the match yesterday?", "ok", "https://example.com", ":)"]
+
+
+def main() -> None:
+    store = GuildSettingsStore(None, default="$")  # type: ignore[arg-type]
+    for guild_id in range(GUILDS):
+        store._store(guild_id, random.choice(["!", "?", "p!", ".", "$$"]))  # pylint: disable=protected-access
+
+    user_id = 800780974274248764
+    bare_mentions = frozenset({f"<@{user_id}>", f"<@!{user_id}>"})
+
+    guild_id = random.randrange(GUILDS)
+    content = random.choice(CHAT_MESSAGES)
+
+    def old_fast_path() -> None:
+        re.fullmatch(rf"<@!?{user_id}>", content)
+
+    def new_fast_path() -> None:
+        if store.matches(guild_id, content):
+            _ = content in bare_mentions
+
+    for name, func in (("old (f-string regex)", old_fast_path), ("new (first-char index)", new_fast_path)):
+        total = timeit.timeit(func, number=NUMBER)
+        print(f"{name:<24} {total / NUMBER * 1e9:8.1f} ns/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Latency of :class:`TimezoneIndex` searches, which back the timezone autocomplete.
+
+Run with ``python -m benchmarks.bench_timezone_index``. Autocomplete responses should stay under 5 ms at p99.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+from dateutil.zoneinfo import get_zonefile_instance
+from rapidfuzz import fuzz, process
+
+from bot.core.cldr import load_snapshot
+from bot.core.timezones import TimezoneIndex
+
+SAMPLES = 5_000
+QUERIES = ["kol", "new york", "America/Los", "tokyo", "ist", "london", "berl", "sao paulo", "Europe/", "syd", "k", "pacific time"]
+
+
+def percentiles(timings: list[float]) -> str:
+    quantiles = statistics.quantiles(timings, n=100)
+    return f"p50 {quantiles[49] * 1e3:6.3f} ms | p99 {quantiles[98] * 1e3:6.3f} ms | max {max(timings) * 1e3:6.3f} ms"
+
+
+def main() -> None:
+    zones = set(get_zonefile_instance().zones)
+    snapshot = load_snapshot()
+    aliases = snapshot["aliases"] if snapshot is not None else {}
+
+    index = TimezoneIndex()
+    index.rebuild(zones=zones, aliases=aliases)
+    print(f"{len(index)} choices ({len(aliases)} aliases)")
+
+    def old(query: str) -> None:
+        _ = process.extract(query, zones if "/" in query else aliases.keys() or zones, scorer=fuzz.WRatio, limit=10)
+
+    for name, func in (("fuzzy_finder", old), ("TimezoneIndex", index.search)):
+        timings: list[float] = []
+        for _ in range(SAMPLES):
+            query = random.choice(QUERIES)
+            start = time.perf_counter()
+            _ = func(query)
+            timings.append(time.perf_counter() - start)
+
+        print(f"{name:<14} {percentiles(timings)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ from rapidfuzz.fuzz import ratio as rf_ratio
 from rapidfuzz.process import extractOne as rf_extract_one
 
 from assets.emojis import Emoji
+from bot.core.cooldowns import shared_cooldown
 
 if TYPE_CHECKING:
     from bot.core import Context, Parrot
@@ -193,7 +194,7 @@ class Fun(commands.Cog, ColorHandler):
     @commands.command(name="typingtest")
     @commands.bot_has_permissions(embed_links=True, add_reactions=True)
     @commands.max_concurrency(1, per=commands.BucketType.user)
-    @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(1, 10)
     async def typing_test(self, ctx: Context[Parrot]):
         """Test your typing skills."""
         confirm: discord.Message = await ctx.send(f"{ctx.author.mention} click on \N{WHITE HEAVY CHECK MARK} to start")
@@ -232,7 +233,7 @@ class Fun(commands.Cog, ColorHandler):
     @commands.command(name="reactiontest")
     @commands.bot_has_permissions(embed_links=True, add_reactions=True)
     @commands.max_concurrency(1, per=commands.BucketType.user)
-    @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(1, 10)
     async def reaction_test(self, ctx: Context[Parrot]):
         """Reaction test, REACT AS FAST AS POSSIBLE."""
         EMOJIS: list[Emoji] = self.bot.assets.random_emojis(5)
@@ -267,7 +268,7 @@ class Fun(commands.Cog, ColorHandler):
 
     @commands.command(name="cathi")
     @commands.max_concurrency(1, per=commands.BucketType.channel)
-    @commands.cooldown(1, 60, commands.BucketType.user)
+    @shared_cooldown(1, 60)
     async def fun_animation_cathi(self, ctx: Context[Parrot], text: str = commands.parameter(description="The text for the cat to say.", default="Hi...")):
         """Make a cat say something."""
         # please dont DM to ask what is this, I forget
@@ -301,7 +302,7 @@ class Fun(commands.Cog, ColorHandler):
 
     @commands.command(name="flop")
     @commands.max_concurrency(1, per=commands.BucketType.channel)
-    @commands.cooldown(1, 60, commands.BucketType.user)
+    @shared_cooldown(1, 60)
     async def fun_animation_flop(self, ctx: Context[Parrot]):
         """Flop."""
         m = await ctx.send("Starting...")
@@ -324,7 +325,7 @@ class Fun(commands.Cog, ColorHandler):
 
     @commands.command(name="poof", hidden=True)
     @commands.max_concurrency(1, per=commands.BucketType.channel)
-    @commands.cooldown(1, 60, commands.BucketType.user)
+    @shared_cooldown(1, 60)
     async def fun_animation_poof(self, ctx: Context[Parrot]):
         """Poof."""
         m: discord.Message = await ctx.send("...")
@@ -335,7 +336,7 @@ class Fun(commands.Cog, ColorHandler):
 
     @commands.command(name="virus", hidden=True)
     @commands.max_concurrency(1, per=commands.BucketType.channel)
-    @commands.cooldown(1, 60, commands.BucketType.user)
+    @shared_cooldown(1, 60)
     async def fun_animation_virus(
         self,
         ctx: Context[Parrot],
@@ -372,7 +373,7 @@ class Fun(commands.Cog, ColorHandler):
 
     @commands.command(name="boom", hidden=True)
     @commands.max_concurrency(1, per=commands.BucketType.channel)
-    @commands.cooldown(1, 60, commands.BucketType.user)
+    @shared_cooldown(1, 60)
     async def fun_animation_boom(self, ctx: Context[Parrot]):
         """Booms a message!."""
         m = await ctx.send("THIS MESSAGE WILL SELFDESTRUCT IN 5")
@@ -392,7 +393,7 @@ class Fun(commands.Cog, ColorHandler):
 
     @commands.command(name="table", hidden=True)
     @commands.max_concurrency(1, per=commands.BucketType.channel)
-    @commands.cooldown(1, 60, commands.BucketType.user)
+    @shared_cooldown(1, 60)
     async def fun_animation_table(self, ctx: Context[Parrot]):
         # Thanks `CutieRei#5211`(830248412904947753)
         DEGREE_SIGN = "\N{DEGREE SIGN}"
@@ -424,7 +425,7 @@ class Fun(commands.Cog, ColorHandler):
 
     @commands.command(name="funwarn", hidden=True)
     @commands.max_concurrency(1, per=commands.BucketType.channel)
-    @commands.cooldown(1, 60, commands.BucketType.user)
+    @shared_cooldown(1, 60)
     async def fun_animation_warning(self, ctx: Context[Parrot]):
         msg = await ctx.send("...")
         IDEA_GRAPHIC_FULL_STOP = "\N{HALFWIDTH IDEOGRAPHIC FULL STOP}"
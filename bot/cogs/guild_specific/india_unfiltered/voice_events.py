@@ -30,29 +30,27 @@ class IndiaUnfilteredVoiceEvents(commands.Cog):
         if guild is None:
             return
 
-        if not guild.chunked:
-            await guild.chunk(cache=True)
-
-        for member in guild.members:
-            cached_channel_id = await maybe_coroutine(self.bot.redis_client.get, f"india_unfiltered:hub_voice_channel:{member.id}")
+        # only members that own a hub channel matter, so walk the keys instead of the (unchunked) member list
+        async for key in self.bot.redis_client.scan_iter(match="india_unfiltered:hub_voice_channel:*"):
+            cached_channel_id = await maybe_coroutine(self.bot.redis_client.get, key)
             if cached_channel_id is None:
                 continue
 
             cached_channel_id = int(cached_channel_id)
             channel = guild.get_channel(cached_channel_id)
             if channel is None:
-                await maybe_coroutine(self.bot.redis_client.delete, f"india_unfiltered:hub_voice_channel:{member.id}")
+                await maybe_coroutine(self.bot.redis_client.delete, key)
                 continue
 
-            if self.__should_delete_channel(member, channel):
+            if self.__should_delete_channel(channel):
                 try:
                     await channel.delete(reason="Cleaning up leftover hub voice channel on bot startup.")
                 except discord.NotFound:
                     pass
 
-            await maybe_coroutine(self.bot.redis_client.delete, f"india_unfiltered:hub_voice_channel:{member.id}")
+            await maybe_coroutine(self.bot.redis_client.delete, key)
 
-    def __should_delete_channel(self, member: discord.Member, channel: discord.abc.GuildChannel) -> bool:
+    def __should_delete_channel(self, channel: discord.abc.GuildChannel) -> bool:
         """Check if the hub voice channel should be deleted."""
         if not isinstance(channel, discord.VoiceChannel):
             return True
@@ -45,9 +45,6 @@ class Sector1729Events(commands.Cog):
         if guild is None:
             return
 
-        if not guild.chunked:
-            await guild.chunk(cache=True)
-
         await self.cleanup_hub_voice_channels()
 
     async def cleanup_hub_voice_channels(self):
@@ -55,15 +52,15 @@ class Sector1729Events(commands.Cog):
         if guild is None:
             return
 
-        for member in guild.members:
-            cached_channel_id = await maybe_coroutine(self.bot.redis_client.get, f"sector1729:hub_voice_channel:{member.id}")
+        async for key in self.bot.redis_client.scan_iter(match="sector1729:hub_voice_channel:*"):
+            cached_channel_id = await maybe_coroutine(self.bot.redis_client.get, key)
             if cached_channel_id is None:
                 continue
 
             cached_channel_id = int(cached_channel_id)
             channel = guild.get_channel(cached_channel_id)
             if channel is None:
-                await maybe_coroutine(self.bot.redis_client.delete, f"sector1729:hub_voice_channel:{member.id}")
+                await maybe_coroutine(self.bot.redis_client.delete, key)
                 continue
 
             if self.__should_delete_channel(channel):
@@ -72,7 +69,7 @@ class Sector1729Events(commands.Cog):
                 except discord.NotFound:
                     pass
 
-            await maybe_coroutine(self.bot.redis_client.delete, f"sector1729:hub_voice_channel:{member.id}")
+            await maybe_coroutine(self.bot.redis_client.delete, key)
 
     def __should_delete_channel(self, channel: discord.abc.GuildChannel) -> bool:
         """Check if the hub voice channel should be deleted."""
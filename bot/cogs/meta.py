@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import datetime
 import time
 from collections import Counter
 
@@ -22,10 +23,11 @@ class Meta(commands.Cog):
         ini = time.perf_counter()
 
         message = await ctx.send("Pong!")
-        latency = self.bot.latency * 1000
+        shard = self.bot.get_shard(ctx.guild.shard_id)
+        latency = (shard.latency if shard is not None else self.bot.latency) * 1000
         end = time.perf_counter()
 
-        content = f"Pong! Bot Latency: **{latency:.2f}** ms | Response Time: **{(end - ini) * 1000:.2f}** ms"
+        content = f"Pong! Shard {ctx.guild.shard_id} Latency: **{latency:.2f}** ms | Response Time: **{(end - ini) * 1000:.2f}** ms | Cluster: **{self.bot.cluster_id}**"
 
         await message.edit(content=content)
 
@@ -43,7 +45,7 @@ class Meta(commands.Cog):
 
         await ctx.reply(embed=embed)
 
-    @commands.command(name="member_count", aliases=["member-count", "mc"])
+    @commands.command(name="member_count", aliases=["member-count", "mc"], extras={"needs_members": True})
     async def member_count(self, ctx: Context[Parrot]):
         """Return the member count of the server."""
         bots = len(list(filter(lambda m: m.bot, ctx.guild.members)))
@@ -97,7 +99,7 @@ class Meta(commands.Cog):
             embed.set_image(url=target.banner.url)
         await ctx.reply(ctx.author.mention, embed=embed)
 
-    @commands.command(name="serverinfo", aliases=["guildinfo", "si", "gi"])
+    @commands.command(name="serverinfo", aliases=["guildinfo", "si", "gi"], extras={"needs_members": True})
     async def server_info(self, ctx: Context[Parrot]):
         """Get the basic stats about the server."""
         guild = ctx.guild
@@ -195,11 +197,79 @@ class Meta(commands.Cog):
 
         await ctx.reply(embed=embed)
 
+    @commands.command(name="prefix")
+    async def prefix(self, ctx: Context[Parrot], *, prefix: str | None = commands.parameter(default=None, description="The new prefix for the server.")):
+        """Show or change the prefix of the server."""
+        if prefix is None:
+            await ctx.reply(f"Prefix: `{await self.bot.get_guild_prefix(ctx.guild)}`")
+            return
+
+        if not ctx.author.guild_permissions.manage_guild:
+            raise commands.MissingPermissions(["manage_guild"])
+
+        try:
+            await self.bot.set_guild_prefix(ctx.guild, prefix)
+        except ValueError as e:
+            raise commands.BadArgument(str(e)) from None
+
+        await ctx.reply(f"Prefix set to `{prefix}`.")
+
+    @commands.command(name="chunkmembers", aliases=["chunk-members"], hidden=True)
+    @commands.is_owner()
+    async def chunk_members(self, ctx: Context[Parrot], enabled: bool = commands.parameter(description="Whether to keep the full member list of the server cached.")):
+        """Opt the server in or out of keeping its full member list cached."""
+        await self.bot.set_member_chunking(ctx.guild, enabled)
+        await ctx.tick()
+
     @commands.command(rest_is_raw=True, hidden=True)
     @commands.is_owner()
     async def echo(self, ctx: Context[Parrot], *, content: str):
         await ctx.send(content)
 
+    @commands.command(name="cachestats", aliases=["cache-stats"], hidden=True)
+    @commands.is_owner()
+    async def cache_stats(self, ctx: Context[Parrot]):
+        """Show hit/miss counters of the in-process caches."""
+        stats = self.bot.user_settings.stats
+        lookups = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / lookups * 100 if lookups else 0
+
+        embed = discord.Embed(title="Cache Stats", color=discord.Color.blurple(), timestamp=discord.utils.utcnow())
+        embed.add_field(
+            name="User Settings", value=f"Hits: {stats['hits']}\nMisses: {stats['misses']}\nHit Ratio: {ratio:.2f}%\nSize: {stats['size']}/{stats['maxsize']}", inline=True
+        )
+
+        await ctx.reply(embed=embed)
+
+    @commands.command(name="clusters", hidden=True)
+    @commands.is_owner()
+    async def clusters(self, ctx: Context[Parrot]):
+        """Show the shards, guilds and gateway latency of every running cluster."""
+        clusters = await self.bot.cluster_health.fetch_all()
+
+        embed = discord.Embed(title="Clusters", color=discord.Color.blurple(), timestamp=discord.utils.utcnow())
+        for cluster in clusters:
+            latencies = cluster["latencies"].values()
+            average = sum(latencies) / len(latencies) * 1000 if latencies else 0
+            shard_ids = cluster["shard_ids"]
+            shards = f"{shard_ids[0]}-{shard_ids[-1]}" if shard_ids else "not known yet"
+            embed.add_field(
+                name=f"Cluster {cluster['cluster_id']}{' (this)' if cluster['cluster_id'] == self.bot.cluster_id else ''}",
+                value=(
+                    f"Shards: {shards}\n"
+                    f"Guilds: {cluster['guilds']}\n"
+                    f"Latency: {average:.2f} ms\n"
+                    f"Status: {'Ready' if cluster['ready'] else 'Starting'}\n"
+                    f"Last Seen: {discord.utils.format_dt(datetime.datetime.fromtimestamp(cluster['updated_at'], datetime.UTC), 'R')}"
+                ),
+                inline=True,
+            )
+
+        if not clusters:
+            embed.description = "No cluster has reported recently."
+
+        await ctx.reply(embed=embed)
+
     @commands.command(hidden=True)
     async def cud(self, ctx: Context[Parrot]):
         """Pls no spam."""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import discord
 import pomice
@@ -187,7 +187,7 @@ class Music(commands.Cog):
         await ctx.tick(emoji="\N{HOURGLASS WITH FLOWING SAND}")
         for host, port, password, identifier in providers:
             try:
-                await self.bot.lavalink_node_pool.create_node(bot=self.bot, host=host, port=int(port), password=password, identifier=identifier)
+                await self.bot.lavalink_node_pool.create_node(bot=cast(commands.Bot, self.bot), host=host, port=int(port), password=password, identifier=identifier)
             except Exception as e:
                 errors.append((identifier, str(e)))
                 continue
@@ -11,7 +11,9 @@ from discord.ext import commands
 
 from bot.core import TimeZone
 
+from ..core.timezones import format_utc_offset, parse_utc_offset
 from ..core.utils import time
+from ..core.utils.converters import TimeZoneTransformer
 
 if TYPE_CHECKING:
     from ..core import Context, Parrot, TimerConfig
@@ -34,7 +36,8 @@ class Reminders(commands.Cog):  # pylint: disable=too-many-public-methods
     async def get_timezone(self, user_id: int) -> str | None:
         return await self.bot.get_timezone(user_id)
 
-    @commands.group(name="timezone", aliases=["tz"], invoke_without_command=True)
+    # hybrid groups take no invoke_without_command, the callback only answers when no subcommand was given
+    @commands.hybrid_group(name="timezone", aliases=["tz"], fallback="show")
     async def timezone(self, ctx: Context[Parrot]) -> None:
         """Commands related to managing or retrieving timezone info."""
         if ctx.invoked_subcommand is None:
@@ -45,7 +48,7 @@ class Reminders(commands.Cog):  # pylint: disable=too-many-public-methods
                 await ctx.send(f"Your current timezone is set to {tz!r}.")
 
     @timezone.command(name="set")
-    async def timezone_set(self, ctx: Context[Parrot], *, timezone: TimeZone = commands.parameter(description="The timezone to set.")) -> None:
+    async def timezone_set(self, ctx: Context[Parrot], *, timezone: Annotated[TimeZone, TimeZoneTransformer] = commands.parameter(description="The timezone to set.")) -> None:
         """Set your timezone.
 
         Timezones can be in the format specified by the IANA Time Zone Database, e.g. `America/New_York`, `Europe/London`, `Asia/Tokyo`, etc.
@@ -60,31 +63,77 @@ class Reminders(commands.Cog):  # pylint: disable=too-many-public-methods
         """
         await self.bot.set_timezone(ctx.author.id, timezone.key)
 
-        utc_offset = datetime.datetime.now(dateutil.tz.gettz(timezone.key)).utcoffset()
-        if utc_offset is not None:
-            hours, remainder = divmod(utc_offset.total_seconds(), 3600)
-            minutes = remainder // 60
-            await ctx.send(f"Your timezone has been set to {timezone.key!r} (UTC{'+' if hours >= 0 else ''}{int(hours):02}:{int(minutes):02}).")
+        zone = self.bot.timezone_offsets.get(timezone.key)
+        if zone is None:
+            await ctx.send(f"Your timezone has been set to {timezone.key!r}.")
+        else:
+            await ctx.send(f"Your timezone has been set to {timezone.key!r} ({format_utc_offset(zone.offset)}).")
 
     @timezone.command(name="info", aliases=["get", "details", "about", "more"])
-    async def timezone_info(self, ctx: Context[Parrot], *, timezone: TimeZone = commands.parameter(description="The timezone to get info about.")) -> None:
+    async def timezone_info(
+        self, ctx: Context[Parrot], *, timezone: Annotated[TimeZone, TimeZoneTransformer] = commands.parameter(description="The timezone to get info about.")
+    ) -> None:
         """Get information about a timezone."""
-        tz = dateutil.tz.gettz(timezone.key)
-        if tz is None:
+        zone = self.bot.timezone_offsets.get(timezone.key)
+        if zone is None:
             await ctx.send(f"Could not find timezone info for {timezone.key!r}.")
             return
 
-        now = arrow.utcnow().to(tz)
-        offset = now.utcoffset()
-        dst = now.dst()
-
         embed = discord.Embed(title=f"Timezone Info: {timezone.key}", color=discord.Color.blue())
-        embed.add_field(name="Current Time", value=now.format("YYYY-MM-DD HH:mm:ss"), inline=False)
-        embed.add_field(name="UTC Offset", value=str(offset), inline=False)
-        embed.add_field(name="DST Active", value=str(bool(dst)), inline=False)
+        embed.add_field(name="Current Time", value=zone.now().strftime("%Y-%m-%d %H:%M:%S"), inline=False)
+        embed.add_field(name="UTC Offset", value=f"{format_utc_offset(zone.offset)} ({zone.abbreviation})", inline=False)
+        embed.add_field(name="DST Active", value=str(zone.dst), inline=False)
+        if zone.next_transition is not None:
+            embed.add_field(name="Next Transition", value=discord.utils.format_dt(zone.next_transition, "R"), inline=False)
 
         await ctx.send(embed=embed)
 
+    @timezone.command(name="offset", aliases=["at", "utc"])
+    async def timezone_offset(self, ctx: Context[Parrot], *, offset: str = commands.parameter(description="The UTC offset, e.g. `UTC+5:30` or `-4`.")) -> None:
+        """List the timezones currently at a UTC offset."""
+        try:
+            delta = parse_utc_offset(offset)
+        except ValueError as e:
+            raise commands.BadArgument(str(e)) from None
+
+        zones = self.bot.timezone_offsets.at_offset(delta)
+        if not zones:
+            await ctx.send(f"No timezone is at {format_utc_offset(delta)} right now.")
+            return
+
+        # zones without an abbreviation of their own are named after their offset, e.g. "+0530"
+        abbreviations = sorted({zone.abbreviation for zone in zones if zone.abbreviation[0] not in "+-"})
+        header = f"**{format_utc_offset(delta)}** {', '.join(abbreviations)}".strip()
+        await ctx.paginate([header, *(zone.key for zone in zones)])
+
+    @timezone.command(name="team", aliases=["members", "everyone"], with_app_command=False)
+    async def timezone_team(
+        self,
+        ctx: Context[Parrot],
+        members: commands.Greedy[discord.Member] = commands.parameter(
+            default=lambda ctx: [ctx.author], displayed_default="you", description="The members to show the time of."
+        ),
+    ) -> None:
+        """Show what time it is for a group of members, grouped by their timezone."""
+        timezones = await self.bot.get_timezones(member.id for member in members)
+
+        groups: dict[str | None, list[discord.Member]] = {}
+        for member in members:
+            groups.setdefault(timezones.get(member.id), []).append(member)
+
+        utcnow = discord.utils.utcnow()
+        lines: list[tuple[datetime.timedelta, str]] = []
+        for key, group in groups.items():
+            names = ", ".join(member.display_name for member in group)
+            zone = self.bot.timezone_offsets.get(key) if key is not None else None
+            if zone is None:
+                lines.append((datetime.timedelta.max, f"**Not set**: {names}"))
+                continue
+
+            lines.append((zone.offset, f"**{zone.now(utcnow):%a %H:%M}** {key} ({format_utc_offset(zone.offset)}): {names}"))
+
+        await ctx.send("\n".join(line for _, line in sorted(lines, key=lambda line: line[0])))
+
     @commands.group(name="reminder", aliases=["remind"], invoke_without_command=True)
     async def reminder(self, ctx: Context[Parrot]) -> None:
         """Commands related to managing reminders."""
@@ -138,10 +187,6 @@ class Reminders(commands.Cog):  # pylint: disable=too-many-public-methods
         if user_id is None:
             return
 
-        user = self.bot.get_user(user_id)
-        if user is None:
-            return
-
         guild = self.bot.get_guild(metadata["guild_id"])
         channel = guild.get_channel(metadata["channel_id"]) if guild else None
         if channel is None:
@@ -149,7 +194,8 @@ class Reminders(commands.Cog):  # pylint: disable=too-many-public-methods
 
         assert isinstance(channel, discord.abc.Messageable)
 
-        await channel.send(f"{user.mention}, this is your reminder: {metadata['content']}", reference=discord.PartialMessage(channel=channel, id=metadata["message_id"]))
+        # members are not chunked, the author is usually not cached, and a mention needs no lookup
+        await channel.send(f"<@{user_id}>, this is your reminder: {metadata['content']}", reference=discord.PartialMessage(channel=channel, id=metadata["message_id"]))
 
 
 async def setup(bot: Parrot) -> None:
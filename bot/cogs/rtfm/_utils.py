@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import importlib.metadata as pkg_resources
 import io
 import os
@@ -12,18 +13,10 @@ from typing import TypeVar
 
 import aiofiles
 import arrow
-import autopep8
-import bandit
 import discord
-import flake8
-import isort
-import pylint
-import pyright
-from black import FileMode, format_str
 from colorama import Fore
 from discord.ext import commands
 from jishaku.paginators import PaginatorInterface
-from yapf.yapflib.yapf_api import FormatCode as yapf_format
 
 from bot.core import Context
 
@@ -220,6 +213,44 @@ async def lint(cmd: str, filename: str) -> dict[str, str]:
     return payload
 
 
+# The linters run as subprocesses and the formatters are rarely used, so none of them is imported
+# until it is needed. The formatters are called through `asyncio.to_thread`, which keeps their
+# (slow) first import off the event loop as well.
+
+
+@functools.cache
+def package_version(name: str) -> str:
+    try:
+        return pkg_resources.version(name)
+    except pkg_resources.PackageNotFoundError:
+        return "Unknown"
+
+
+def format_with_black(source: str) -> str:
+    from black import FileMode, format_str  # pylint: disable=import-outside-toplevel
+
+    return format_str(source, mode=FileMode())
+
+
+def format_with_isort(source: str) -> str:
+    import isort  # pylint: disable=import-outside-toplevel
+
+    return isort.code(source)
+
+
+def format_with_autopep8(source: str) -> str:
+    import autopep8  # pylint: disable=import-outside-toplevel
+
+    return autopep8.fix_code(source)
+
+
+def format_with_yapf(source: str) -> str:
+    from yapf.yapflib.yapf_api import FormatCode  # pylint: disable=import-outside-toplevel
+
+    res = FormatCode(source)
+    return res[0] if isinstance(res, tuple) else res
+
+
 FlagT = TypeVar("FlagT", Flake8Converter, MypyConverter, PyLintConverter, BanditConverter, PyrightConverter, RuffConverter, str)
 
 
@@ -311,7 +342,7 @@ class LintCode:
         if data.get("stdout"):
             json_data = json.loads(data["stdout"])
             pages = commands.Paginator(prefix="```ansi", suffix="```", max_size=1980)
-            pages.add_line(f"{Fore.WHITE}Pyright Version - {Fore.WHITE}{pyright.__version__}\n")
+            pages.add_line(f"{Fore.WHITE}Pyright Version - {Fore.WHITE}{package_version('pyright')}\n")
 
             pages.add_line(
                 f"{Fore.RED}{json_data['summary']['errorCount']} errors - {Fore.YELLOW}{json_data['summary']['warningCount']} warnings - {Fore.BLUE}{json_data['summary']['informationCount']} information"
@@ -355,7 +386,7 @@ class LintCode:
         if data.get("stdout"):
             json_data: dict = json.loads(data["stdout"])
             pages = commands.Paginator(prefix="```ansi", suffix="```", max_size=1980)
-            pages.add_line(f"{Fore.WHITE}Flake8 Version - {Fore.WHITE}{flake8.__version__}\n")
+            pages.add_line(f"{Fore.WHITE}Flake8 Version - {Fore.WHITE}{package_version('flake8')}\n")
             interface = PaginatorInterface(ctx.bot, pages, owner=ctx.author)
             await interface.send_to(ctx)
 
@@ -388,12 +419,7 @@ class LintCode:
             pages = commands.Paginator(prefix="```ansi", suffix="```", max_size=1980)
 
             # Thanks `AAA3A#1157` (829612600059887649)
-            try:
-                ruff_version = pkg_resources.version("ruff")
-            except pkg_resources.PackageNotFoundError:
-                ruff_version = "Unknown"
-
-            pages.add_line(f"{Fore.WHITE}Ruff Version - {Fore.WHITE}{ruff_version}\n")  # TODO: Get version from ruff
+            pages.add_line(f"{Fore.WHITE}Ruff Version - {Fore.WHITE}{package_version('ruff')}\n")
 
             interface = PaginatorInterface(ctx.bot, pages, owner=ctx.author)
             await interface.send_to(ctx)
@@ -437,7 +463,7 @@ class LintCode:
 
             pages = commands.Paginator(prefix="```ansi", suffix="```", max_size=1980)
 
-            pages.add_line(f"{Fore.WHITE}Pylint Version - {Fore.WHITE}{pylint.__version__}\n")
+            pages.add_line(f"{Fore.WHITE}Pylint Version - {Fore.WHITE}{package_version('pylint')}\n")
 
             interface = PaginatorInterface(ctx.bot, pages, owner=ctx.author)
             await interface.send_to(ctx)
@@ -459,7 +485,7 @@ class LintCode:
         if data.get("stdout"):
             json_data = json.loads(data["stdout"])
             pages = commands.Paginator(prefix="```ansi", suffix="```", max_size=1980)
-            pages.add_line(f"{Fore.MAGENTA}Bandit Version - {Fore.MAGENTA}{bandit.__version__}\n")
+            pages.add_line(f"{Fore.MAGENTA}Bandit Version - {Fore.MAGENTA}{package_version('bandit')}\n")
 
             interface = PaginatorInterface(ctx.bot, pages, owner=ctx.author)
             await interface.send_to(ctx)
@@ -530,7 +556,7 @@ class LintCode:
 
     async def run_black(self, ctx: Context) -> None:
         ini = time.perf_counter()
-        res = await asyncio.to_thread(format_str, self.source, mode=FileMode())
+        res = await asyncio.to_thread(format_with_black, self.source)
         end = time.perf_counter()
 
         if res == self.source:
@@ -545,7 +571,7 @@ class LintCode:
 
     async def run_isort(self, ctx: Context) -> None:
         ini = time.perf_counter()
-        res: str = await asyncio.to_thread(isort.code, self.source)
+        res: str = await asyncio.to_thread(format_with_isort, self.source)
         end = time.perf_counter()
 
         if res == self.source:
@@ -561,7 +587,7 @@ class LintCode:
 
     async def run_autopep8(self, ctx: Context) -> None:
         ini = time.perf_counter()
-        res = await asyncio.to_thread(autopep8.fix_code, self.source)
+        res = await asyncio.to_thread(format_with_autopep8, self.source)
         end = time.perf_counter()
 
         if res == self.source:
@@ -576,9 +602,7 @@ class LintCode:
 
     async def run_yapf(self, ctx: Context) -> None:
         ini = time.perf_counter()
-        res = await asyncio.to_thread(yapf_format, self.source)
-        if isinstance(res, tuple):
-            res = res[0]
+        res = await asyncio.to_thread(format_with_yapf, self.source)
 
         end = time.perf_counter()
 
@@ -593,12 +617,9 @@ class LintCode:
         await ctx.reply(f"```ansi\n{Fore.GREEN}[Formated Code in {int(end - ini)} seconds]``````py\n{res}```")
 
     async def run_isort_with_black(self, ctx: Context) -> None:
-        import isort
-        from black import FileMode, format_str
-
         ini = time.perf_counter()
-        res = await asyncio.to_thread(isort.code, self.source)
-        res = await asyncio.to_thread(format_str, res, mode=FileMode())
+        res = await asyncio.to_thread(format_with_isort, self.source)
+        res = await asyncio.to_thread(format_with_black, res)
         end = time.perf_counter()
 
         if res == self.source:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from discord.ext import commands
 
 from bot.core import Context, Parrot
+from bot.core.cooldowns import shared_cooldown
 
 from ._utils import BanditConverter, Flake8Converter, LintCode, MypyConverter, PyLintConverter, PyrightConverter, RuffConverter
 
@@ -14,7 +15,7 @@ class Linter(commands.Cog):
         self.bot = bot
 
     @commands.group(name="lintcode", aliases=["lint"], invoke_without_command=True)
-    @commands.cooldown(1, 5, commands.BucketType.user)
+    @shared_cooldown(1, 5)
     @commands.max_concurrency(1, commands.BucketType.user)
     async def lintcode(self, ctx: Context[Parrot]):
         """To lint your codes."""
@@ -25,6 +25,7 @@ from jishaku.paginators import PaginatorEmbedInterface
 from rapidfuzz.process import extractOne
 
 from ...core import Context, Parrot
+from ...core.cooldowns import shared_cooldown
 from ...core.utils.converters import WrappedMessageConverter
 from . import _doc, _ref
 from ._kontests import AtCoder, CodeForces, CSAcademy, HackerEarth, HackerRank
@@ -575,7 +576,7 @@ class RTFM(commands.Cog):
             return await r.json()
 
     @commands.group(name="github", aliases=("gh", "git", "g"))  # Thanks `will.#0021` (211756205721255947)
-    @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(1, 10)
     async def github_group(self, ctx: Context[Parrot]) -> None:
         """Commands for finding information related to GitHub."""
         if ctx.invoked_subcommand is None:
@@ -679,7 +680,7 @@ class RTFM(commands.Cog):
         await ctx.send(embed=embed)
 
     @commands.command(aliases=["rp"])
-    @commands.cooldown(1, 10, commands.cooldowns.BucketType.user)
+    @shared_cooldown(1, 10)
     async def realpython(
         self,
         ctx: Context,
@@ -729,7 +730,7 @@ class RTFM(commands.Cog):
         await ctx.send(embed=article_embed)
 
     @commands.command(aliases=["so"])
-    @commands.cooldown(1, 15, commands.cooldowns.BucketType.user)
+    @shared_cooldown(1, 15)
     async def stackoverflow(self, ctx: Context[Parrot], *, query: str = commands.parameter(description="The search terms to look for.")) -> None:
         """Sends the top 5 results of a search query from stackoverflow."""
         params = {**STACKOVERFLOW_PARAMS, "q": query}
@@ -843,6 +844,8 @@ class RTFM(commands.Cog):
             maybe_message = ctx.message.reference.resolved
             if isinstance(maybe_message, discord.Message):
                 target_message = maybe_message
+            elif maybe_message is None and ctx.message.reference.message_id is not None:
+                target_message = await self.bot.get_or_fetch_message(ctx.channel, ctx.message.reference.message_id)
 
         if not target_message:
             msg = "Couldn't find that message."
@@ -990,7 +993,7 @@ class RTFM(commands.Cog):
         return view
 
     @commands.command(aliases=["kata"])
-    @commands.cooldown(1, 5, commands.BucketType.user)
+    @shared_cooldown(1, 5)
     async def challenge(self, ctx: Context[Parrot], language: str = "python", *, query: str | None = None) -> None:
         """The challenge command pulls a random kata (challenge) from codewars.com.
         The different ways to use this command are:
@@ -1062,7 +1065,7 @@ class RTFM(commands.Cog):
         await ctx.tick()
 
     @commands.command(name="kontests")
-    @commands.cooldown(1, 15, commands.BucketType.user)
+    @shared_cooldown(1, 15)
     async def kontests(
         self,
         ctx: Context[Parrot],
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import datetime
+import logging
 import os
-import re
-from typing import Any, Iterable, NamedTuple, NotRequired, Self, TypedDict, override
+import time
+from typing import Any, Iterable, Self, cast, override
 
 import aiohttp
 import arrow
@@ -13,20 +13,29 @@ import dateutil
 import discord
 import jishaku
 import pomice
-import pymongo
-import pymongo.errors
 from bson import ObjectId
 from dateutil.zoneinfo import get_zonefile_instance
 from discord.ext import commands
-from lxml import etree  # type: ignore
 from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.asynchronous.mongo_client import AsyncMongoClient
-from rapidfuzz import fuzz, process
 from redis.asyncio import Redis
 
+from .chunking import ChunkCoordinator, ChunkPriority
+from .cldr import CLDRSnapshot, fetch_snapshot, load_snapshot, write_snapshot
+from .cluster import ClusterHealthReporter
 from .context import Context
+from .cooldowns import charge_shared_cooldown
+from .extensions import ExtensionLoader, LazyExtension, LazyExtensionManager, discover_plugins
+from .guild_settings import GuildSettingsStore
 from .help import HelpCommand
-from .utils import Assets, TimeZone
+from .members import MemberResolver
+from .timers import BaseTimerScheduler, RedisTimerScheduler, TimerConfig, TimerScheduler, TimingWheel
+from .timezones import TimezoneIndex, TimezoneOffsetTable
+from .user_settings import UserSettingsCache
+from .utils import Assets, LRUCache, MemberConverter, TimeZone
+from .utils.cache import invalidator
+
+logger = logging.getLogger(__name__)
 
 os.environ["JISHAKU_HIDE"] = "True"
 os.environ["JISHAKU_NO_UNDERSCORE"] = "True"
@@ -37,6 +46,9 @@ intents = discord.Intents.default()
 intents.members = True
 intents.message_content = True
 
+# every `discord.Member` parameter goes through the member resolver instead of relying on a chunked guild
+commands.converter.CONVERTER_MAPPING[discord.Member] = MemberConverter
+
 
 MONGO_HOST = os.environ.get("MONGO_HOST", "localhost")
 MONGO_PORT = int(os.environ.get("MONGO_PORT", 27017))
@@ -48,16 +60,6 @@ DEFAULT_PREFIX = "$"
 
 # fmt: off
 __all_cogs__ = [
-    # Guild Specific Cogs
-    # INDIA UNFILTERED
-    "bot.cogs.guild_specific.india_unfiltered.channel_events",
-    "bot.cogs.guild_specific.india_unfiltered.member_events",
-    "bot.cogs.guild_specific.india_unfiltered.message_events",
-    "bot.cogs.guild_specific.india_unfiltered.voice_events",
-
-    # SECTOR 17-29
-    "bot.cogs.guild_specific.sector_17_29.events",
-
     # Common
     "bot.cogs.common.scam_link_detection",
     "bot.cogs.common.link_to_codeblock",
@@ -65,71 +67,86 @@ __all_cogs__ = [
 
     "bot.cogs.meta",
     "bot.cogs.fun",
+    "bot.cogs.reminder",
     "bot.cogs.mod",
     "bot.cogs.rtfm.rtfm",
-    "bot.cogs.rtfm.linter",
     "bot.cogs.music",
 ]
-# fmt: on
 
+INDIA_UNFILTERED_ID = 776415524056727582
+SECTOR_17_29_ID = 741614680652644382
 
-class CLDRDataEntry(NamedTuple):
-    description: str
-    aliases: list[str]
-    deprecated: bool
-    preferred: str | None
+# only imported once their guild shows up or one of their commands is used
+__lazy_cogs__ = [
+    # Guild Specific Cogs
+    # INDIA UNFILTERED
+    LazyExtension("bot.cogs.guild_specific.india_unfiltered.channel_events", guild_ids=[INDIA_UNFILTERED_ID]),
+    LazyExtension("bot.cogs.guild_specific.india_unfiltered.member_events", guild_ids=[INDIA_UNFILTERED_ID]),
+    LazyExtension("bot.cogs.guild_specific.india_unfiltered.message_events", guild_ids=[INDIA_UNFILTERED_ID]),
+    LazyExtension("bot.cogs.guild_specific.india_unfiltered.voice_events", guild_ids=[INDIA_UNFILTERED_ID]),
 
+    # SECTOR 17-29
+    LazyExtension("bot.cogs.guild_specific.sector_17_29.events", guild_ids=[SECTOR_17_29_ID]),
 
-class TimerConfig(TypedDict):
-    _id: NotRequired[ObjectId]
-    event_name: str
-    created_at: datetime.datetime
-    due_date: datetime.datetime
+    LazyExtension(
+        "bot.cogs.rtfm.linter",
+        commands={"lintcode": ["lint"], "flake8": ["f8", "flake"], "pylint": ["pyl"], "bandit": ["bd"], "pyright": ["pyr"], "ruff": ["rf"]},
+        description="Lint your code.",
+    ),
+]
+# fmt: on
 
-    metadata: dict[str, Any]
+# extension -> extensions that have to be loaded before it, everything else is loaded concurrently
+EXTENSION_DEPENDENCIES: dict[str, tuple[str, ...]] = {}
 
 
-class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
+class Parrot(commands.AutoShardedBot):  # pylint: disable=too-many-public-methods
     DATABASE_NAME = "parrotDiscordBot"
 
+    # BCP 47 id -> IANA zone, used as is until a CLDR snapshot says otherwise
     DEFAULT_POPULAR_TIMEZONE_IDS = {
         # America
-        "usnyc",  # America/New_York
-        "uslax",  # America/Los_Angeles
-        "uschi",  # America/Chicago
-        "usden",  # America/Denver
+        "usnyc": "America/New_York",
+        "uslax": "America/Los_Angeles",
+        "uschi": "America/Chicago",
+        "usden": "America/Denver",
         # India
-        "inccu",  # Asia/Kolkata
+        "inccu": "Asia/Kolkata",
         # Europe
-        "trist",  # Europe/Istanbul
-        "rumow",  # Europe/Moscow
-        "gblon",  # Europe/London
-        "frpar",  # Europe/Paris
-        "esmad",  # Europe/Madrid
-        "deber",  # Europe/Berlin
-        "grath",  # Europe/Athens
-        "uaiev",  # Europe/Kyev
-        "itrom",  # Europe/Rome
-        "nlams",  # Europe/Amsterdam
-        "plwaw",  # Europe/Warsaw
+        "trist": "Europe/Istanbul",
+        "rumow": "Europe/Moscow",
+        "gblon": "Europe/London",
+        "frpar": "Europe/Paris",
+        "esmad": "Europe/Madrid",
+        "deber": "Europe/Berlin",
+        "grath": "Europe/Athens",
+        "uaiev": "Europe/Kiev",
+        "itrom": "Europe/Rome",
+        "nlams": "Europe/Amsterdam",
+        "plwaw": "Europe/Warsaw",
         # Canada
-        "cator",  # America/Toronto
+        "cator": "America/Toronto",
         # Australia
-        "aubne",  # Australia/Brisbane
-        "ausyd",  # Australia/Sydney
+        "aubne": "Australia/Brisbane",
+        "ausyd": "Australia/Sydney",
         # Brazil
-        "brsao",  # America/Sao_Paulo
+        "brsao": "America/Sao_Paulo",
         # Japan
-        "jptyo",  # Asia/Tokyo
+        "jptyo": "Asia/Tokyo",
         # China
-        "cnsha",  # Asia/Shanghai
+        "cnsha": "Asia/Shanghai",
     }
 
+    MAX_MESSAGES = 2000
+    MESSAGE_INDEX_SIZE = MAX_MESSAGES * 2
+
     user: discord.ClientUser  # pyright: ignore[reportIncompatibleMethodOverride]
 
     assets = Assets()
 
-    def __init__(self, version: str):
+    def __init__(self, version: str, *, cluster_id: int = 0, shard_ids: list[int] | None = None, shard_count: int | None = None):
+        # without shard ids AutoShardedBot runs every shard, from 0 to shard_count - 1
+        shard_options: dict[str, Any] = {} if shard_ids is None else {"shard_ids": shard_ids}
         super().__init__(
             command_prefix=self.get_prefix,  # pyright: ignore[reportArgumentType]
             intents=intents,
@@ -137,11 +154,13 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
             strip_after_prefix=True,
             case_insensitive=True,
             status=discord.Status.dnd,
-            max_messages=2000,
+            max_messages=self.MAX_MESSAGES,
             member_cache_flags=discord.MemberCacheFlags.from_intents(intents),
             allowed_mentions=discord.AllowedMentions(users=True, roles=True, replied_user=False, everyone=False),
             enable_debug_events=False,
             help_command=HelpCommand(),
+            shard_count=shard_count,
+            **shard_options,
         )
 
         self._BotBase__cogs = commands.core._CaseInsensitiveDict()  # pyright: ignore[reportPrivateUsage]
@@ -150,20 +169,36 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
 
         self.timer_collection: AsyncCollection[TimerConfig] = self._db["timers"]
         self.user_configurations_collection = self._db["user_configurations"]
+        self.guild_configurations_collection = self._db["guild_configurations"]
 
         self.redis_client = Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True, protocol=3)
+        self.user_settings = UserSettingsCache(self)
+        self.user_settings_task: asyncio.Task[None] | None = None
+        self.guild_settings = GuildSettingsStore(self, default=DEFAULT_PREFIX)
+        self.chunker = ChunkCoordinator(self)
+        self.lazy_extensions = LazyExtensionManager(self)
+        self.member_resolver = MemberResolver(self)
         self.version = version
         self.support_server_link = ""
 
+        self.cluster_id = cluster_id
+        self.cluster_health = ClusterHealthReporter(self)
+        self.cluster_health_task: asyncio.Task[None] | None = None
+
         self.uptime = arrow.now().datetime
 
         self.before_invoke(self.__before_invoke)
         self.check_once(self.__check_once)
 
-        self._timer_event = asyncio.Event()
-        self._current_timer: TimerConfig | None = None
+        # "mongo" for a single process, "redis" when several processes share the timer load.
+        # Read here rather than at import, main.py imports the bot before loading .env
+        timer_backend = os.environ.get("TIMER_BACKEND", "mongo")
+        self.timer_scheduler: BaseTimerScheduler = RedisTimerScheduler(self) if timer_backend == "redis" else TimerScheduler(self)
         self.timer_task: asyncio.Task[None] | None = None
 
+        self.timing_wheel = TimingWheel(self)
+        self.short_timer_task: asyncio.Task[None] | None = None
+
         self.valid_timezones: set[str] = set(get_zonefile_instance().zones)
         self._timezone_aliases: dict[str, str] = {
             "Eastern Time": "America/New_York",
@@ -188,8 +223,21 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
             "UTC": "UTC",
             "GMT": "UTC",
         }
+        self.cldr_snapshot: CLDRSnapshot | None = load_snapshot()
+        if self.cldr_snapshot is not None:
+            self._timezone_aliases.update(self.cldr_snapshot["aliases"])
+        self.cldr_refresh_task: asyncio.Task[None] | None = None
+
+        self.timezone_index = TimezoneIndex()
+        self.rebuild_timezone_index()
+
+        self.timezone_offsets = TimezoneOffsetTable()
+        self.timezone_offsets.build(self.valid_timezones)
         self.broadcasted_messages: list[str] = []
 
+        # messages fetched from the API, the gateway's own message cache is looked up first
+        self.message_index: LRUCache[int, discord.Message] = LRUCache(maxsize=self.MESSAGE_INDEX_SIZE)
+
         self.lavalink_node_pool: pomice.NodePool = pomice.NodePool()
         self.default_lavalink_node: pomice.Node | None = None
 
@@ -201,14 +249,15 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
         return self.http._HTTPClient__session  # type: ignore  # pylint: disable=protected-access
 
     async def on_ready(self):
-        print(f"[Parrot] Logged in as {self.user} (ID: {self.user.id})")
+        print(f"[Parrot] Logged in as {self.user} (ID: {self.user.id}) on cluster {self.cluster_id} with shards {sorted(self.shards)}")
 
         await self.mongo_client["admin"].command("ping")
         await self.redis_client.ping()  # type: ignore
 
         if not self.ON_READY_EVENT_FIRED:
             if self.default_lavalink_node is None:
-                node = await self.lavalink_node_pool.create_node(bot=self, host="localhost", port=2333, password="youshallnotpass", identifier="MAIN")
+                # pomice only types commands.Bot, the sharded bot works the same
+                node = await self.lavalink_node_pool.create_node(bot=cast(commands.Bot, self), host="localhost", port=2333, password="youshallnotpass", identifier="MAIN")
 
             self.default_lavalink_node = node
 
@@ -219,38 +268,74 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
         if message.guild is None:
             return []
 
-        prefix = await self.get_guild_prefix(message.guild)
-        inner = commands.when_mentioned_or(prefix)
+        inner = commands.when_mentioned_or(self.guild_settings.get_prefix(message.guild.id))
         return inner(self, message)
 
+    def could_be_command(self, message: discord.Message, /) -> bool:
+        """Cheap synchronous check that rules out messages which cannot start with a prefix or a mention."""
+        return message.guild is not None and self.guild_settings.matches(message.guild.id, message.content)
+
+    @discord.utils.cached_property
+    def bare_mentions(self) -> frozenset[str]:
+        return frozenset({f"<@{self.user.id}>", f"<@!{self.user.id}>"})
+
     async def setup_hook(self) -> None:
-        await self.load_extension(jishaku.__name__)
+        self.chunker.start()
+
+        plugins, lazy_plugins = discover_plugins()
+        for extension in (*__lazy_cogs__, *lazy_plugins):
+            self.lazy_extensions.register(extension)
 
-        for ext in __all_cogs__:
-            await self.load_extension(ext)
+        start = time.perf_counter()
+        loader = ExtensionLoader(self, [jishaku.__name__, *__all_cogs__, *plugins], dependencies=EXTENSION_DEPENDENCIES)
+        loader.report(await loader.load(), time.perf_counter() - start)
 
         self.timer_task = self.loop.create_task(self.dispatch_timer())
-        await self.parse_bcp47_timezones()
+        self.short_timer_task = self.loop.create_task(self.timing_wheel.run())
+        self.user_settings_task = self.loop.create_task(self.user_settings.listen())
+        self.cluster_health_task = self.loop.create_task(self.cluster_health.run())
+        await self.user_settings.ensure_indexes()
+        await self.guild_settings.ensure_indexes()
+        self.cldr_refresh_task = self.loop.create_task(self.refresh_cldr_timezones())
 
     @override
     async def close(self) -> None:
+        # stop everything that may still talk to Mongo, Redis or Discord before closing the clients under it
+        tasks = [task for task in (self.timer_task, self.short_timer_task, self.user_settings_task, self.cluster_health_task, self.cldr_refresh_task) if task is not None]
+        for task in tasks:
+            _ = task.cancel()
+
+        _ = await asyncio.gather(*tasks, return_exceptions=True)
+
+        await self.timer_scheduler.close()
+        await self.guild_settings.close()
+        await self.member_resolver.close()
+        await self.lazy_extensions.close()
+        await self.chunker.close()
+        await invalidator.close()
+
         await self.mongo_client.close()
         await self.redis_client.close()
 
         if self.http_session and not self.http_session.closed:
             await self.http_session.close()
 
-        if self.timer_task is not None:
-            self.timer_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self.timer_task
-
         await super().close()
 
     async def __before_invoke(self, ctx: Context[Self]) -> None:
-        if ctx.guild is not None and not ctx.guild.chunked:  # pyright: ignore[reportUnnecessaryComparison]
+        await charge_shared_cooldown(ctx)
+
+        if ctx.guild is None or ctx.guild.chunked:  # pyright: ignore[reportUnnecessaryComparison]
+            return
+
+        if ctx.command is not None and ctx.command.extras.get("needs_members"):
             await ctx.bot.wait_until_ready()
-            await ctx.guild.chunk()
+            await self.chunker.ensure(ctx.guild)
+            return
+
+        # the author comes with the message, so the command can go ahead while the guild is chunked in the background
+        if self.guild_settings.chunks_members(ctx.guild.id):
+            _ = self.chunker.request(ctx.guild, priority=ChunkPriority.COMMAND)
 
     async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
         if after.author.bot:
@@ -261,16 +346,72 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
 
     @override
     async def on_message(self, message: discord.Message, /) -> None:
-        if message.guild is None or message.author.bot:
+        if message.guild is None or message.author.bot or not self.could_be_command(message):
             return
 
-        if self.user and re.fullmatch(rf"<@!?{self.user.id}>", message.content) and message.channel.permissions_for(message.guild.me).send_messages:
-            _ = await message.channel.send(f"Prefix: `{await self.get_guild_prefix(message.guild)}`", reference=message)
+        if message.content in self.bare_mentions and message.channel.permissions_for(message.guild.me).send_messages:
+            _ = await message.channel.send(f"Prefix: `{self.guild_settings.get_prefix(message.guild.id)}`", reference=message)
 
         await self.process_commands(message)
 
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        # fetched copies are not updated in place like the gateway's cached messages
+        self.message_index.pop(payload.message_id)
+
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        self.message_index.pop(payload.message_id)
+
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        for message_id in payload.message_ids:
+            self.message_index.pop(message_id)
+
+    async def on_guild_available(self, guild: discord.Guild) -> None:
+        self.guild_settings.queue(guild.id)
+        await self.lazy_extensions.on_guild(guild.id)
+
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        self.guild_settings.queue(guild.id)
+        await self.lazy_extensions.on_guild(guild.id)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.guild_settings.forget(guild.id)
+        self.member_resolver.index.forget(guild.id)
+
+    async def on_guild_settings_loaded(self, guild_ids: set[int]) -> None:
+        # full member lists are opt-in, everyone else is served by the member resolver
+        for guild_id in guild_ids:
+            guild = self.get_guild(guild_id)
+            if guild is not None and self.guild_settings.chunks_members(guild_id):
+                _ = self.chunker.request(guild, priority=ChunkPriority.BACKGROUND)
+
+    async def on_guild_chunked(self, guild: discord.Guild) -> None:
+        if guild.id in self.member_resolver.index:
+            self.member_resolver.index.build(guild)
+
+    async def on_member_join(self, member: discord.Member) -> None:
+        self.member_resolver.forget(member.guild.id, member.id)
+        self.member_resolver.index.add(member)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if before.nick != after.nick:
+            self.member_resolver.index.add(after)
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        self.member_resolver.index.remove(member.guild.id, member.id)
+
+    async def on_user_update(self, before: discord.User, after: discord.User) -> None:
+        if (before.name, before.global_name) == (after.name, after.global_name):
+            return
+
+        for guild in after.mutual_guilds:
+            if guild.id in self.member_resolver.index and (member := guild.get_member(after.id)) is not None:
+                self.member_resolver.index.add(member)
+
     @override
     async def process_commands(self, message: discord.Message, /) -> None:
+        if not self.could_be_command(message):
+            return
+
         context: Context[Self] = await self.get_context(message, cls=Context)
 
         if self.is_ready():
@@ -292,79 +433,70 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
         raise TypeError("origin must be a Message or Interaction")
 
     async def get_guild_prefix(self, guild: discord.Guild) -> str:
-        return DEFAULT_PREFIX
+        return self.guild_settings.get_prefix(guild.id)
+
+    async def set_guild_prefix(self, guild: discord.Guild, prefix: str) -> None:
+        await self.guild_settings.set_prefix(guild.id, prefix)
+
+    async def set_member_chunking(self, guild: discord.Guild, enabled: bool) -> None:
+        await self.guild_settings.set_chunk_members(guild.id, enabled)
+        if enabled:
+            _ = self.chunker.request(guild, priority=ChunkPriority.BACKGROUND)
 
     async def get_or_fetch_message(self, channel: discord.abc.MessageableChannel, message_id: int) -> discord.Message | None:
-        for message in self.cached_messages:
-            if message_id == message.id:
-                return message
+        message = self._connection._get_message(message_id)  # pyright: ignore[reportPrivateUsage] # pylint: disable=protected-access
+        if message is None:
+            message = self.message_index.get(message_id, None)
+
+        if message is not None:
+            return message
 
         try:
-            return await channel.fetch_message(message_id)
+            message = await channel.fetch_message(message_id)
         except discord.NotFound:
             return None
 
+        self.message_index.set(message_id, message)
+        return message
+
     async def __check_once(self, ctx: Context[Self]) -> bool:
         return True
 
     # Timer related methods
 
     async def get_active_timer(self) -> TimerConfig | None:
-        timer = await self.timer_collection.find_one(sort=[("due_date", pymongo.ASCENDING)])
-        return timer
-
-    async def wait_for_active_timers(self) -> TimerConfig | None:
-        timer = await self.get_active_timer()
-        if timer is not None:
-            self._timer_event.set()
-            return timer
-
-        self._timer_event.clear()
-        self._current_timer = None
-        await self._timer_event.wait()
-
-        return await self.get_active_timer()
+        return await self.timer_scheduler.get_active_timer()
 
     async def dispatch_timer(self):
-        try:
-            while not self.is_closed():
-                timer = self._current_timer = await self.wait_for_active_timers()
-                if timer is None:
-                    continue
-
-                now = arrow.utcnow().datetime
-                if timer["due_date"] > now:
-                    wait_seconds = (timer["due_date"] - now).total_seconds()
-                    await asyncio.sleep(wait_seconds)
-
-                if self._current_timer is None:
-                    continue
-
-                await self.call_timer(self._current_timer)
-
-        except (OSError, discord.ConnectionClosed, pymongo.errors.ConnectionFailure):
-            if self.timer_task is not None:
-                _ = self.timer_task.cancel()
-                self.timer_task = self.loop.create_task(self.dispatch_timer())
+        await self.timer_scheduler.run()
 
     async def call_timer(self, timer: TimerConfig) -> None:
-        event_name = timer["event_name"]
-        await self.delete_timer(timer)
+        """Dispatch a due timer, then acknowledge it to the scheduler once every listener has returned.
 
-        self.dispatch(event_name, timer)
+        Listener errors go to ``on_error`` as usual and are not raised here.
+        """
+        # dispatch schedules each listener as a task named after the event, and schedules nothing else
+        before = asyncio.all_tasks()
+        self.dispatch(timer["event_name"], timer)
+        task_name = f"discord.py: on_{timer['event_name']}"
+        listeners = [task for task in asyncio.all_tasks() - before if task.get_name() == task_name]
+
+        _ = await asyncio.gather(*listeners, return_exceptions=True)
+        await self.timer_scheduler.ack(timer)
 
     async def delete_timer(self, timer: TimerConfig) -> None:
-        if self._current_timer is not None and timer.get("_id") == self._current_timer.get("_id"):
-            delete_result = await self.timer_collection.delete_one({"_id": timer.get("_id")})
-            if delete_result.deleted_count > 0:
-                self._current_timer = None
-                self._timer_event.set()
+        timer_id = timer.get("_id")
+        if timer_id is None:
+            return
 
-    async def short_dispatcher(self, timer: TimerConfig) -> None:
-        wait_seconds = (timer["due_date"] - arrow.utcnow().datetime).total_seconds()
-        await asyncio.sleep(wait_seconds)
+        await self.cancel_timer(timer_id)
 
-        self.dispatch(timer["event_name"], timer)
+    async def cancel_timer(self, timer_id: ObjectId, /) -> bool:
+        """Cancel a pending timer, short or persisted. Returns whether anything was cancelled."""
+        if self.timing_wheel.cancel(timer_id) is not None:
+            return True
+
+        return await self.timer_scheduler.remove(timer_id)
 
     async def create_timer(self, /, *, event_name: str, due_date: datetime.datetime, metadata: dict[str, Any]):
         now = arrow.utcnow().datetime
@@ -372,61 +504,43 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
         delta = (due_date - now).total_seconds()
         if delta <= 60:
             # Short Dispatch
-            self.loop.create_task(self.short_dispatcher(timer))
+            _ = self.timing_wheel.schedule(timer)
             return timer
 
-        _ = await self.timer_collection.insert_one(timer)
-        self._timer_event.set()
-
-        if self._current_timer and due_date < self._current_timer["due_date"]:
-            if self.timer_task is not None:
-                _ = self.timer_task.cancel()
-                self.timer_task = self.loop.create_task(self.dispatch_timer())
+        await self.timer_scheduler.add(timer)
 
         return timer
 
-    def fuzzy_finder(self, query: str, /, *, choices: Iterable[str]) -> list[str]:
-        results = process.extract(query, choices, scorer=fuzz.WRatio, limit=10)
-        return [a for a, score, _ in results if score >= 60]
-
-    def find_timezones(self, query: str, /) -> list[TimeZone]:
-        if "/" in query:
-            return [TimeZone(key=a, label=a) for a in self.fuzzy_finder(query, choices=self.valid_timezones)]
-
-        keys = self.fuzzy_finder(query, choices=self._timezone_aliases.keys())
-        return [TimeZone(label=k, key=self._timezone_aliases[k]) for k in keys]
-
-    async def parse_bcp47_timezones(self) -> None:
-        async with self.http_session.get("https://raw.githubusercontent.com/unicode-org/cldr/main/common/bcp47/timezone.xml") as resp:
-            if resp.status != 200:
-                return
-
-            parser: Any = etree.XMLParser(  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType] # pylint: disable=c-extension-no-member
-                ns_clean=True, recover=True, encoding="utf-8"
-            )
-            tree: Any = etree.fromstring(  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType] # pylint: disable=c-extension-no-member
-                await resp.read(), parser=parser
-            )
-
-            entries: dict[str, CLDRDataEntry] = {
-                node.attrib["name"]: CLDRDataEntry(  # pyright: ignore[reportUnknownMemberType]
-                    description=node.attrib["description"],  # pyright: ignore[reportUnknownMemberType]
-                    aliases=node.get("alias", "Etc/Unknown").split(" "),  # pyright: ignore[reportUnknownMemberType]
-                    deprecated=node.get("deprecated", "false") == "true",  # pyright: ignore[reportUnknownMemberType]
-                    preferred=node.get("preferred"),  # pyright: ignore[reportUnknownMemberType]
-                )
-                for node in tree.iter("type")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                if not node.attrib["name"].startswith(("utcw", "utce", "unk"))  # pyright: ignore[reportUnknownMemberType]
-                and not node.attrib["description"].startswith("POSIX")  # pyright: ignore[reportUnknownMemberType]
-            }
-
-            for entry in entries.values():
-                if entry.preferred is not None:
-                    preferred = entries.get(entry.preferred)
-                    if preferred is not None:
-                        self._timezone_aliases[entry.description] = preferred.aliases[0]
-                else:
-                    self._timezone_aliases[entry.description] = entry.aliases[0]
+    def find_timezones(self, query: str, /, *, limit: int = 10) -> list[TimeZone]:
+        return self.timezone_index.search(query, limit=limit)
+
+    def rebuild_timezone_index(self) -> None:
+        ids = self.cldr_snapshot["ids"] if self.cldr_snapshot is not None else {}
+        popular = {ids.get(bcp47_id, zone) for bcp47_id, zone in self.DEFAULT_POPULAR_TIMEZONE_IDS.items()} & self.valid_timezones
+        self.timezone_index.rebuild(zones=self.valid_timezones, aliases=self._timezone_aliases, popular=popular)
+
+    async def refresh_cldr_timezones(self) -> None:
+        """Fetch the CLDR snapshot if there is none yet, or replace it if upstream has changed since it was built."""
+        etag = self.cldr_snapshot["etag"] if self.cldr_snapshot is not None else None
+        try:
+            snapshot = await fetch_snapshot(self.http_session, etag=etag)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            logger.warning("Could not refresh CLDR timezones, keeping the current snapshot", exc_info=True)
+            return
+
+        if snapshot is None or (self.cldr_snapshot is not None and snapshot["version"] == self.cldr_snapshot["version"]):
+            return
+
+        self._timezone_aliases.update(snapshot["aliases"])
+        self.cldr_snapshot = snapshot
+        self.rebuild_timezone_index()
+        try:
+            await asyncio.to_thread(write_snapshot, snapshot)
+        except OSError:
+            logger.warning("Could not write the CLDR timezone snapshot", exc_info=True)
+            return
+
+        logger.info("Updated CLDR timezone snapshot to version %s", snapshot["version"][:12])
 
     async def get_tzinfo(self, user_id: int, /) -> datetime.tzinfo:
         tz = await self.get_timezone(user_id)
@@ -436,11 +550,12 @@ class Parrot(commands.Bot):  # pylint: disable=too-many-public-methods
         return dateutil.tz.gettz(tz) or datetime.timezone.utc
 
     async def get_timezone(self, user_id: int, /) -> str | None:
-        data = await self.user_configurations_collection.find_one({"id": user_id}, {"timezone": 1})
-        if data is None:
-            return None
+        settings = await self.user_settings.get(user_id)
+        return settings.get("timezone")
 
-        return data.get("timezone")
+    async def get_timezones(self, user_ids: Iterable[int], /) -> dict[int, str | None]:
+        settings = await self.user_settings.get_many(user_ids)
+        return {user_id: data.get("timezone") for user_id, data in settings.items()}
 
     async def set_timezone(self, user_id: int, timezone: str) -> None:
-        await self.user_configurations_collection.update_one({"id": user_id}, {"$set": {"timezone": timezone}}, upsert=True)
+        _ = await self.user_settings.update(user_id, timezone=timezone)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from .bot import Parrot
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkPriority:
+    COMMAND = 0
+    COG = 5
+    BACKGROUND = 10
+
+
+class ChunkCoordinator:
+    """Serialises guild chunk requests.
+
+    Concurrent requests for the same guild share a single future, queued requests are served by priority,
+    and every shard is kept well under the gateway limit of 120 commands per minute so that chunking
+    never starves heartbeats, presence or voice updates.
+    """
+
+    REQUESTS_PER_WINDOW = 30
+    WINDOW = 60
+    CONCURRENCY = 2
+    TIMEOUT = 120
+
+    def __init__(self, bot: Parrot) -> None:
+        self.bot = bot
+
+        self._queue: asyncio.PriorityQueue[tuple[int, int, int]] = asyncio.PriorityQueue()
+        self._counter = itertools.count()
+        self._inflight: dict[int, asyncio.Future[None]] = {}
+        self._priorities: dict[int, int] = {}
+        self._sent: defaultdict[int, deque[float]] = defaultdict(deque)
+
+        self._workers: list[asyncio.Task[None]] = []
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.CONCURRENCY)]
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            _ = worker.cancel()
+
+        _ = await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def request(self, guild: discord.Guild, /, *, priority: int = ChunkPriority.BACKGROUND) -> asyncio.Future[None]:
+        """Queue ``guild`` for chunking. Returns a future that resolves once it is chunked."""
+        future = self._inflight.get(guild.id)
+        if future is None:
+            future = self._inflight[guild.id] = asyncio.get_running_loop().create_future()
+            if guild.chunked:
+                self._resolve(guild.id)
+                return future
+
+        # requeueing with a better priority is cheaper than reordering the heap, stale entries are skipped
+        if priority < self._priorities.get(guild.id, ChunkPriority.BACKGROUND + 1):
+            self._priorities[guild.id] = priority
+            self._queue.put_nowait((priority, next(self._counter), guild.id))
+
+        return future
+
+    async def ensure(self, guild: discord.Guild, /, *, priority: int = ChunkPriority.COMMAND) -> None:
+        if guild.chunked:
+            return
+
+        await asyncio.shield(self.request(guild, priority=priority))
+
+    def _resolve(self, guild_id: int, exc: BaseException | None = None) -> None:
+        self._priorities.pop(guild_id, None)
+        future = self._inflight.pop(guild_id, None)
+        if future is None or future.done():
+            return
+
+        if exc is None:
+            future.set_result(None)
+        else:
+            future.set_exception(exc)
+            # nobody may be waiting on a background request
+            _ = future.exception()
+
+    async def _wait_for_slot(self, shard_id: int) -> None:
+        sent = self._sent[shard_id]
+        while True:
+            now = time.monotonic()
+            while sent and sent[0] <= now - self.WINDOW:
+                _ = sent.popleft()
+
+            if len(sent) < self.REQUESTS_PER_WINDOW:
+                sent.append(now)
+                return
+
+            await asyncio.sleep(sent[0] + self.WINDOW - now)
+
+    async def _worker(self) -> None:
+        await self.bot.wait_until_ready()
+
+        while not self.bot.is_closed():
+            priority, _, guild_id = await self._queue.get()
+            if self._priorities.get(guild_id) != priority:
+                # already served, or superseded by a higher priority entry
+                continue
+
+            guild = self.bot.get_guild(guild_id)
+            if guild is None or guild.chunked:
+                self._resolve(guild_id)
+                continue
+
+            # claim it so that the stale lower priority entries are skipped
+            self._priorities[guild_id] = -1
+
+            await self._wait_for_slot(guild.shard_id)
+            try:
+                _ = await asyncio.wait_for(guild.chunk(cache=True), timeout=self.TIMEOUT)
+            except (asyncio.TimeoutError, discord.ClientException, discord.ConnectionClosed) as e:
+                logger.warning("Chunking guild_id=%s failed", guild_id, exc_info=True)
+                self._resolve(guild_id, e)
+            else:
+                logger.debug("Chunked guild_id=%s (%s members)", guild_id, guild.member_count)
+                self._resolve(guild_id)
+                self.bot.dispatch("guild_chunked", guild)
@@ -0,0 +1,143 @@
+"""CLDR BCP 47 timezone aliases ("Kolkata, India" -> "Asia/Kolkata").
+
+The alias table is compiled from ``common/bcp47/timezone.xml`` into a small JSON snapshot under ``assets/``,
+which is read synchronously at startup. The snapshot is meant to be checked in; a background refresh replaces it
+only when upstream changes, and writes it on the first start if it is missing.
+
+Build the snapshot ahead of time with ``python -m bot.core.cldr``, or ``python -m bot.core.cldr path/to/timezone.xml``
+from a CLDR checkout or release when GitHub is not reachable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pathlib
+from typing import Any, NamedTuple, TypedDict
+
+import aiohttp
+from lxml import etree  # type: ignore
+
+from .utils.assets import Paths
+
+logger = logging.getLogger(__name__)
+
+TIMEZONE_XML_URL = "https://raw.githubusercontent.com/unicode-org/cldr/main/common/bcp47/timezone.xml"
+SNAPSHOT_FORMAT = 2
+
+
+class CLDRDataEntry(NamedTuple):
+    description: str
+    aliases: list[str]
+    deprecated: bool
+    preferred: str | None
+
+
+class CLDRSnapshot(TypedDict):
+    format: int
+    # sha256 of the source document, the upstream file carries no usable version of its own
+    version: str
+    etag: str | None
+    aliases: dict[str, str]
+    # BCP 47 id ("usnyc") -> canonical IANA zone
+    ids: dict[str, str]
+
+
+def parse_timezone_xml(data: bytes) -> tuple[dict[str, str], dict[str, str]]:
+    parser: Any = etree.XMLParser(  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType] # pylint: disable=c-extension-no-member
+        ns_clean=True, recover=True, encoding="utf-8"
+    )
+    tree: Any = etree.fromstring(data, parser=parser)  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType] # pylint: disable=c-extension-no-member
+
+    entries: dict[str, CLDRDataEntry] = {
+        node.attrib["name"]: CLDRDataEntry(  # pyright: ignore[reportUnknownMemberType]
+            description=node.attrib["description"],  # pyright: ignore[reportUnknownMemberType]
+            aliases=node.get("alias", "Etc/Unknown").split(" "),  # pyright: ignore[reportUnknownMemberType]
+            deprecated=node.get("deprecated", "false") == "true",  # pyright: ignore[reportUnknownMemberType]
+            preferred=node.get("preferred"),  # pyright: ignore[reportUnknownMemberType]
+        )
+        for node in tree.iter("type")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        if not node.attrib["name"].startswith(("utcw", "utce", "unk"))  # pyright: ignore[reportUnknownMemberType]
+        and not node.attrib["description"].startswith("POSIX")  # pyright: ignore[reportUnknownMemberType]
+    }
+
+    aliases: dict[str, str] = {}
+    ids: dict[str, str] = {}
+    for name, entry in entries.items():
+        if entry.preferred is not None:
+            preferred = entries.get(entry.preferred)
+            if preferred is not None:
+                aliases[entry.description] = ids[name] = preferred.aliases[0]
+        else:
+            aliases[entry.description] = ids[name] = entry.aliases[0]
+
+    return aliases, ids
+
+
+def build_snapshot(data: bytes, *, etag: str | None = None) -> CLDRSnapshot:
+    aliases, ids = parse_timezone_xml(data)
+    return CLDRSnapshot(format=SNAPSHOT_FORMAT, version=hashlib.sha256(data).hexdigest(), etag=etag, aliases=aliases, ids=ids)
+
+
+def load_snapshot(path: pathlib.Path = Paths.CLDR_TIMEZONES.value) -> CLDRSnapshot | None:
+    try:
+        with open(path, "rb") as file:
+            snapshot: CLDRSnapshot = json.load(file)
+    except FileNotFoundError:
+        logger.warning("No CLDR timezone snapshot at %s, aliases will be missing until it is fetched", path)
+        return None
+    except ValueError:
+        logger.warning("Corrupt CLDR timezone snapshot at %s", path, exc_info=True)
+        return None
+
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        logger.warning("CLDR timezone snapshot at %s has an unknown format, ignoring it", path)
+        return None
+
+    return snapshot
+
+
+def write_snapshot(snapshot: CLDRSnapshot, path: pathlib.Path = Paths.CLDR_TIMEZONES.value) -> None:
+    # readers in other processes must never see a half written file
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as file:
+        json.dump(snapshot, file, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+    os.replace(tmp, path)
+
+
+async def fetch_snapshot(session: aiohttp.ClientSession, /, *, etag: str | None = None) -> CLDRSnapshot | None:
+    """The latest upstream snapshot, or ``None`` if it has not changed since ``etag``."""
+    headers = {"If-None-Match": etag} if etag else {}
+    async with session.get(TIMEZONE_XML_URL, headers=headers) as resp:
+        if resp.status == 304:
+            return None
+
+        resp.raise_for_status()
+        data = await resp.read()
+        new_etag = resp.headers.get("ETag")
+
+    # parsing is a few milliseconds of CPU, keep it off the event loop anyway
+    return await asyncio.to_thread(build_snapshot, data, etag=new_etag)
+
+
+async def _build(source: str | None = None) -> None:
+    if source is None:
+        async with aiohttp.ClientSession() as session:
+            snapshot = await fetch_snapshot(session)
+        assert snapshot is not None
+    else:
+        # no ETag, the first background refresh downloads the upstream file once and compares versions
+        snapshot = build_snapshot(pathlib.Path(source).read_bytes())
+
+    write_snapshot(snapshot)
+    print(f"Wrote {len(snapshot['aliases'])} aliases (version {snapshot['version'][:12]}) to {Paths.CLDR_TIMEZONES.value}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    asyncio.run(_build(sys.argv[1] if len(sys.argv) > 1 else None))
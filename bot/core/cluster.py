@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+from typing import TYPE_CHECKING, TypedDict, cast
+
+import aiohttp
+import redis.exceptions
+from discord.utils import maybe_coroutine
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from .bot import Parrot
+
+logger = logging.getLogger(__name__)
+
+GATEWAY_BOT_URL = "https://discord.com/api/v10/gateway/bot"
+# a session start bucket allows one IDENTIFY every 5 seconds
+IDENTIFY_INTERVAL = 5
+
+
+class ClusterHealth(TypedDict):
+    cluster_id: int
+    pid: int
+    shard_ids: list[int]
+    guilds: int
+    latencies: dict[str, float]
+    ready: bool
+    updated_at: float
+
+
+class ClusterHealthReporter:
+    """Publishes the health of this process to a Redis hash that every cluster can read."""
+
+    KEY = "parrot:clusters"
+    INTERVAL = 15
+    # a cluster that has not reported for this long is considered down
+    STALE_AFTER = INTERVAL * 4
+
+    def __init__(self, bot: Parrot) -> None:
+        self.bot = bot
+
+    def shard_ids(self) -> list[int]:
+        # the configured shards, `bot.shards` only fills up as each shard is identified after setup_hook;
+        # empty until the gateway's recommended count is known when no shard count was given
+        if self.bot.shard_ids is not None:
+            return sorted(self.bot.shard_ids)
+
+        return list(range(self.bot.shard_count or 0))
+
+    def snapshot(self) -> ClusterHealth:
+        return ClusterHealth(
+            cluster_id=self.bot.cluster_id,
+            pid=os.getpid(),
+            shard_ids=self.shard_ids(),
+            guilds=len(self.bot.guilds),
+            latencies={str(shard_id): latency for shard_id, latency in self.bot.latencies},
+            ready=self.bot.is_ready(),
+            updated_at=time.time(),
+        )
+
+    async def report(self) -> None:
+        _ = await maybe_coroutine(self.bot.redis_client.hset, self.KEY, str(self.bot.cluster_id), json.dumps(self.snapshot()))
+
+    async def fetch_all(self) -> list[ClusterHealth]:
+        data = cast(dict[str, str], await maybe_coroutine(self.bot.redis_client.hgetall, self.KEY))
+        now = time.time()
+
+        clusters: list[ClusterHealth] = [json.loads(value) for value in data.values()]
+        return sorted((cluster for cluster in clusters if now - cluster["updated_at"] < self.STALE_AFTER), key=lambda c: c["cluster_id"])
+
+    async def run(self) -> None:
+        while not self.bot.is_closed():
+            try:
+                await self.report()
+            except (OSError, redis.exceptions.ConnectionError):
+                logger.warning("Could not report health of cluster %s", self.bot.cluster_id, exc_info=True)
+
+            await asyncio.sleep(self.INTERVAL)
+
+
+def shard_ranges(shard_count: int, cluster_count: int) -> list[list[int]]:
+    """Split ``range(shard_count)`` into ``cluster_count`` contiguous, evenly sized chunks."""
+    per_cluster, extra = divmod(shard_count, cluster_count)
+
+    ranges: list[list[int]] = []
+    start = 0
+    for cluster_id in range(cluster_count):
+        end = start + per_cluster + (cluster_id < extra)
+        ranges.append(list(range(start, end)))
+        start = end
+
+    return [shard_ids for shard_ids in ranges if shard_ids]
+
+
+async def fetch_gateway_info(token: str) -> tuple[int, int]:
+    """The recommended shard count and the IDENTIFY concurrency of the bot."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(GATEWAY_BOT_URL, headers={"Authorization": f"Bot {token}"}) as resp:
+            resp.raise_for_status()
+            data = await resp.json()
+
+    return data["shards"], data["session_start_limit"]["max_concurrency"]
+
+
+def run_cluster(version: str, cluster_id: int, shard_ids: list[int], shard_count: int) -> None:
+    from .bot import Parrot  # pylint: disable=import-outside-toplevel
+    from .logs import setup_logging  # pylint: disable=import-outside-toplevel
+
+    # a spawned process starts without the parent's handlers
+    _ = setup_logging(cluster_id=cluster_id)
+
+    async def runner() -> None:
+        parrot = Parrot(version=version, cluster_id=cluster_id, shard_ids=shard_ids, shard_count=shard_count)
+        await parrot.start(os.environ["DISCORD_BOT_TOKEN"])
+
+    asyncio.run(runner())
+
+
+class ClusterLauncher:
+    """Runs the bot as several processes, each owning a contiguous range of shards.
+
+    Every cluster is a full :class:`Parrot` on its own event loop; anything they share
+    (timers, cooldowns, caches, hub channel ownership) lives in Redis or Mongo.
+    A cluster that dies is restarted with the same shards.
+    """
+
+    RESTART_DELAY = 5
+    POLL_INTERVAL = 1
+
+    def __init__(self, *, version: str, cluster_count: int, shard_count: int | None = None) -> None:
+        self.version = version
+        self.cluster_count = cluster_count
+        self.shard_count = shard_count
+
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: dict[int, BaseProcess] = {}
+
+    def _spawn(self, cluster_id: int, shard_ids: list[int], shard_count: int) -> None:
+        process = self._context.Process(target=run_cluster, args=(self.version, cluster_id, shard_ids, shard_count), name=f"parrot-cluster-{cluster_id}", daemon=False)
+        process.start()
+        self._processes[cluster_id] = process
+        logger.info("Started cluster %s (pid=%s) with shards %s-%s", cluster_id, process.pid, shard_ids[0], shard_ids[-1])
+
+    def run(self) -> None:
+        if os.environ.get("TIMER_BACKEND", "redis") != "redis":
+            logger.warning("TIMER_BACKEND=%s cannot be shared between clusters, using redis instead", os.environ["TIMER_BACKEND"])
+        # timers persisted by the Mongo backend are moved over by cluster 0, see RedisTimerScheduler.migrate_from_mongo
+        os.environ["TIMER_BACKEND"] = "redis"
+
+        recommended, max_concurrency = asyncio.run(fetch_gateway_info(os.environ["DISCORD_BOT_TOKEN"]))
+        shard_count = self.shard_count or recommended
+        clusters = dict(enumerate(shard_ranges(shard_count, self.cluster_count)))
+
+        logger.info("Launching %s clusters for %s shards", len(clusters), shard_count)
+        try:
+            for cluster_id, shard_ids in clusters.items():
+                self._spawn(cluster_id, shard_ids, shard_count)
+                # let the cluster identify its shards before the next one starts competing for the same buckets
+                time.sleep(IDENTIFY_INTERVAL * len(shard_ids) / max_concurrency)
+
+            self._supervise(clusters, shard_count)
+        except KeyboardInterrupt:
+            logger.info("Shutting down %s clusters", len(self._processes))
+        finally:
+            self._terminate()
+
+    def _supervise(self, clusters: dict[int, list[int]], shard_count: int) -> None:
+        while self._processes:
+            time.sleep(self.POLL_INTERVAL)
+
+            for cluster_id, process in list(self._processes.items()):
+                if process.is_alive():
+                    continue
+
+                del self._processes[cluster_id]
+                if process.exitcode == 0:
+                    logger.info("Cluster %s exited", cluster_id)
+                    continue
+
+                logger.warning("Cluster %s died with exit code %s, restarting in %s seconds", cluster_id, process.exitcode, self.RESTART_DELAY)
+                time.sleep(self.RESTART_DELAY)
+                self._spawn(cluster_id, clusters[cluster_id], shard_count)
+
+    def _terminate(self) -> None:
+        for process in self._processes.values():
+            process.terminate()
+
+        for process in self._processes.values():
+            process.join(timeout=30)
+
+        self._processes.clear()
@@ -7,6 +7,7 @@ import discord
 from discord.ext import commands
 from jishaku.paginators import PaginatorEmbedInterface
 
+from .cooldowns import reset_shared_cooldowns
 from .utils import Player
 
 if TYPE_CHECKING:
@@ -62,6 +63,7 @@ class Context(commands.Context[BotT]):
 
         if self.command is not None:
             self.command.reset_cooldown(self)
+            await reset_shared_cooldowns(self)
 
         return message
 
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+import redis.exceptions
+from discord.ext import commands
+
+if TYPE_CHECKING:
+    from .context import Context
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SharedCooldown:
+    """Fixed window cooldown counted in Redis, so that it holds across every cluster.
+
+    Use it in place of :func:`commands.cooldown` for buckets that are not bound to a single guild,
+    such as :attr:`commands.BucketType.user`, which a user could otherwise dodge by switching servers.
+
+    Unlike a check, it is only charged from the bot's ``before_invoke`` hook, once every check has passed
+    and the arguments have been converted, so ``can_run``, the help command and failed invocations are free.
+    """
+
+    KEY_PREFIX = "cooldown"
+
+    def __init__(self, rate: int, per: float, type: commands.BucketType) -> None:  # pylint: disable=redefined-builtin
+        self.cooldown = commands.Cooldown(rate, per)
+        self.type = type
+
+    def key(self, ctx: Context[Any]) -> str:
+        assert ctx.command is not None
+        return f"{self.KEY_PREFIX}:{ctx.command.qualified_name}:{self.type.get_key(ctx)}"
+
+    async def charge(self, ctx: Context[Any]) -> None:
+        key = self.key(ctx)
+        try:
+            async with ctx.bot.redis_client.pipeline(transaction=True) as pipe:
+                # the first use opens the window, INCR keeps the expiry (PEXPIRE NX would need Redis 7)
+                _ = pipe.set(key, 0, px=int(self.cooldown.per * 1000), nx=True)
+                _ = pipe.incr(key)
+                _ = pipe.pttl(key)
+                _, count, ttl = await pipe.execute()
+        except (OSError, redis.exceptions.ConnectionError):
+            # rather let a command through than lock everyone out while Redis is away
+            logger.warning("Could not check cooldown %s", key, exc_info=True)
+            return
+
+        if count > self.cooldown.rate:
+            raise commands.CommandOnCooldown(self.cooldown, max(ttl, 0) / 1000, self.type)
+
+    async def reset(self, ctx: Context[Any]) -> None:
+        key = self.key(ctx)
+        try:
+            _ = await ctx.bot.redis_client.delete(key)
+        except (OSError, redis.exceptions.ConnectionError):
+            # the window runs out on its own
+            logger.warning("Could not reset cooldown %s", key, exc_info=True)
+
+
+def shared_cooldown(rate: int, per: float, type: commands.BucketType = commands.BucketType.user) -> Callable[[T], T]:  # pylint: disable=redefined-builtin
+    cooldown = SharedCooldown(rate, per, type)
+
+    def decorator(func: T) -> T:
+        callback = func.callback if isinstance(func, commands.Command) else func
+        callback.__shared_cooldown__ = cooldown  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def get_shared_cooldown(command: commands.Command[Any, ..., Any]) -> SharedCooldown | None:
+    return getattr(command.callback, "__shared_cooldown__", None)
+
+
+async def charge_shared_cooldown(ctx: Context[Any]) -> None:
+    if ctx.command is None:
+        return
+
+    cooldown = get_shared_cooldown(ctx.command)
+    if cooldown is not None:
+        await cooldown.charge(ctx)
+
+
+async def reset_shared_cooldowns(ctx: Context[Any]) -> None:
+    if ctx.command is None:
+        return
+
+    cooldown = get_shared_cooldown(ctx.command)
+    if cooldown is not None:
+        await cooldown.reset(ctx)
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import ast
+import asyncio
+import graphlib
+import logging
+import pathlib
+import time
+from typing import TYPE_CHECKING, Any, Coroutine, Generator, Iterable, Mapping, NamedTuple
+
+from discord.ext import commands
+
+if TYPE_CHECKING:
+    from .bot import Parrot
+    from .context import Context
+
+logger = logging.getLogger(__name__)
+
+PLUGINS_PATH = pathlib.Path("plugins")
+
+
+class ExtensionLoadResult(NamedTuple):
+    name: str
+    # wall time from the start of the load until `setup` (and every `cog_load`) returned,
+    # this includes the time other extensions held the event loop in between
+    elapsed: float
+    # time this extension held the event loop: the module import, then the rest of `setup`
+    import_time: float
+    setup_time: float
+    error: BaseException | None = None
+
+
+class StepTimer:
+    """Awaits a coroutine one step at a time and times each step, i.e. each stretch it holds the event loop for.
+
+    Loading an extension runs the import and ``setup`` up to its first ``await`` in the first step, what
+    other tasks do on the loop while the extension waits for I/O is not counted.
+    """
+
+    def __init__(self, coro: Coroutine[Any, Any, None]) -> None:
+        self._coro = coro
+        self.steps: list[float] = []
+
+    @property
+    def first(self) -> float:
+        return self.steps[0] if self.steps else 0
+
+    @property
+    def rest(self) -> float:
+        return sum(self.steps[1:])
+
+    def __await__(self) -> Generator[Any, Any, None]:
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            start = time.perf_counter()
+            try:
+                future = self._coro.send(value) if error is None else self._coro.throw(error)
+            except StopIteration:
+                return
+            finally:
+                self.steps.append(time.perf_counter() - start)
+
+            try:
+                value, error = (yield future), None
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                # cancellation included, handing it to the coroutine is what awaiting it directly would do
+                value, error = None, e
+
+
+class ExtensionLoader:
+    """Loads extensions concurrently, each one as soon as the extensions it depends on are loaded.
+
+    Importing a module still blocks the event loop, but the awaited parts of ``setup`` and ``cog_load``
+    (network, Redis, Mongo) overlap, so startup takes about as long as the slowest extension.
+    An extension whose dependency failed is skipped rather than loaded into a broken state.
+    """
+
+    def __init__(self, bot: Parrot, extensions: Iterable[str], *, dependencies: Mapping[str, Iterable[str]] | None = None) -> None:
+        self.bot = bot
+        dependencies = dependencies or {}
+        self.graph: dict[str, set[str]] = {name: set(dependencies.get(name, ())) for name in extensions}
+
+        unknown = {dep for deps in self.graph.values() for dep in deps} - self.graph.keys()
+        if unknown:
+            raise ValueError(f"Unknown extension dependencies: {', '.join(sorted(unknown))}")
+
+    async def _load(self, name: str) -> ExtensionLoadResult:
+        start = time.perf_counter()
+        timer = StepTimer(self.bot.load_extension(name))
+        try:
+            await timer
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to load extension %s", name)
+            return ExtensionLoadResult(name, time.perf_counter() - start, timer.first, timer.rest, e)
+
+        return ExtensionLoadResult(name, time.perf_counter() - start, timer.first, timer.rest)
+
+    async def load(self) -> list[ExtensionLoadResult]:
+        sorter = graphlib.TopologicalSorter(self.graph)
+        sorter.prepare()  # raises graphlib.CycleError
+
+        results: dict[str, ExtensionLoadResult] = {}
+        pending: dict[asyncio.Task[ExtensionLoadResult], str] = {}
+
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                failed = next((dep for dep in self.graph[name] if results[dep].error is not None), None)
+                if failed is not None:
+                    logger.warning("Skipping extension %s, its dependency %s failed to load", name, failed)
+                    results[name] = ExtensionLoadResult(name, 0, 0, 0, results[failed].error)
+                    sorter.done(name)
+                    continue
+
+                pending[asyncio.create_task(self._load(name))] = name
+
+            if not pending:
+                continue
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = pending.pop(task)
+                results[name] = task.result()
+                sorter.done(name)
+
+        return [results[name] for name in self.graph]
+
+    @staticmethod
+    def report(results: list[ExtensionLoadResult], total: float) -> None:
+        width = max((len(result.name) for result in results), default=0)
+        lines = [
+            f"{result.name:<{width}} import {result.import_time * 1000:8.1f} ms  setup {result.setup_time * 1000:8.1f} ms  wall {result.elapsed * 1000:8.1f} ms"
+            f"{'  FAILED' if result.error is not None else ''}"
+            for result in sorted(results, key=lambda r: r.import_time + r.setup_time, reverse=True)
+        ]
+        logger.info(
+            "Loaded %s extensions in %.1f ms (import %.1f ms, setup %.1f ms on the event loop)\n%s",
+            len(results),
+            total * 1000,
+            sum(result.import_time for result in results) * 1000,
+            sum(result.setup_time for result in results) * 1000,
+            "\n".join(lines),
+        )
+
+
+class LazyExtension:
+    """An extension that is only imported once it is needed.
+
+    ``guild_ids``: load it as soon as one of these guilds becomes available.
+    ``commands``: top level command name -> aliases. Stubs are registered under these names
+    and the first invocation of any of them loads the extension and re-runs the message.
+    """
+
+    __slots__ = ("name", "guild_ids", "commands", "description")
+
+    def __init__(self, name: str, /, *, guild_ids: Iterable[int] = (), commands: Mapping[str, Iterable[str]] | None = None, description: str = "") -> None:
+        self.name = name
+        self.guild_ids = frozenset(guild_ids)
+        self.commands = {command: tuple(aliases) for command, aliases in (commands or {}).items()}
+        self.description = description
+
+    def __repr__(self) -> str:
+        return f"<LazyExtension name={self.name!r} guild_ids={sorted(self.guild_ids)} commands={list(self.commands)}>"
+
+
+def discover_plugins(path: pathlib.Path = PLUGINS_PATH) -> tuple[list[str], list[LazyExtension]]:
+    """Extensions dropped into ``plugins/``, split into the ones to load at startup and the lazy ones.
+
+    A plugin is lazy if it assigns a literal ``__lazy__ = {"guilds": [...], "commands": {...}, "description": "..."}``
+    at module level. It is read with :mod:`ast`, so the plugin is not imported until it is actually needed.
+    """
+    eager: list[str] = []
+    lazy: list[LazyExtension] = []
+    if not path.is_dir():
+        return eager, lazy
+
+    for entry in sorted(path.iterdir()):
+        if entry.name.startswith(("_", ".")):
+            continue
+
+        if entry.is_dir() and (entry / "__init__.py").is_file():
+            source = entry / "__init__.py"
+        elif entry.suffix == ".py":
+            source = entry
+        else:
+            continue
+
+        name = f"{path.name}.{entry.stem}"
+        try:
+            options = _read_lazy_options(source)
+        except (SyntaxError, ValueError):
+            logger.warning("Ignoring plugin %s, its __lazy__ is not a literal dict", name, exc_info=True)
+            continue
+
+        if options is None:
+            eager.append(name)
+        else:
+            lazy.append(LazyExtension(name, guild_ids=options.get("guilds", ()), commands=options.get("commands"), description=options.get("description", "")))
+
+    return eager, lazy
+
+
+def _read_lazy_options(source: pathlib.Path) -> dict[str, Any] | None:
+    tree = ast.parse(source.read_text(encoding="utf-8"), filename=str(source))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(target, ast.Name) and target.id == "__lazy__" for target in node.targets):
+            options = ast.literal_eval(node.value)
+            if not isinstance(options, dict):
+                raise ValueError("__lazy__ must be a dict")
+            return options
+
+    return None
+
+
+class LazyExtensionManager:
+    def __init__(self, bot: Parrot) -> None:
+        self.bot = bot
+
+        self._extensions: dict[str, LazyExtension] = {}
+        self._by_guild: dict[int, set[str]] = {}
+        self._loading: dict[str, asyncio.Task[bool]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._extensions
+
+    @property
+    def pending(self) -> list[LazyExtension]:
+        return list(self._extensions.values())
+
+    def register(self, extension: LazyExtension, /) -> None:
+        self._extensions[extension.name] = extension
+        for guild_id in extension.guild_ids:
+            self._by_guild.setdefault(guild_id, set()).add(extension.name)
+
+        self._add_stubs(extension)
+
+    def _add_stubs(self, extension: LazyExtension) -> None:
+        for name, aliases in extension.commands.items():
+            self.bot.add_command(self._make_stub(extension, name, aliases))
+
+    def _remove_stubs(self, extension: LazyExtension) -> None:
+        for name in extension.commands:
+            command = self.bot.get_command(name)
+            if command is not None and command.extras.get("lazy_extension") == extension.name:
+                _ = self.bot.remove_command(name)
+
+    def _make_stub(self, extension: LazyExtension, name: str, aliases: tuple[str, ...]) -> commands.Command[Any, ..., Any]:
+        async def stub(ctx: Context[Parrot]) -> None:
+            if not await self.load(extension.name):
+                await ctx.reply("This command is unavailable right now, try again later.")
+                return
+
+            # parse the message again, now against the real command
+            await self.bot.invoke(await self.bot.get_context(ctx.message))
+
+        return commands.command(name=name, aliases=list(aliases), brief=extension.description, extras={"lazy_extension": extension.name})(stub)
+
+    def load(self, name: str, /) -> asyncio.Task[bool]:
+        """Load a registered extension. Concurrent calls share one load."""
+        task = self._loading.get(name)
+        if task is None:
+            task = self._loading[name] = asyncio.create_task(self._load(name))
+            task.add_done_callback(lambda _: self._loading.pop(name, None))
+
+        return task
+
+    async def close(self) -> None:
+        tasks = list(self._loading.values())
+        for task in tasks:
+            _ = task.cancel()
+
+        _ = await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _load(self, name: str) -> bool:
+        extension = self._extensions.get(name)
+        if extension is None:
+            # already loaded by an earlier trigger
+            return name in self.bot.extensions
+
+        self._remove_stubs(extension)
+        timer = StepTimer(self.bot.load_extension(name))
+        try:
+            await timer
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to lazily load extension %s", name)
+            self._add_stubs(extension)
+            return False
+
+        del self._extensions[name]
+        for guild_id in extension.guild_ids:
+            names = self._by_guild.get(guild_id)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._by_guild[guild_id]
+
+        logger.info("Lazily loaded extension %s (import %.1f ms, setup %.1f ms)", name, timer.first * 1000, timer.rest * 1000)
+        return True
+
+    async def on_guild(self, guild_id: int, /) -> None:
+        # entries are dropped once loaded, a failed load is retried on the next GUILD_CREATE
+        names = self._by_guild.get(guild_id)
+        if names:
+            _ = await asyncio.gather(*(self.load(name) for name in list(names)))
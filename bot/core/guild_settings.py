@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Iterable
+
+import pymongo
+import pymongo.errors
+
+if TYPE_CHECKING:
+    from .bot import Parrot
+
+logger = logging.getLogger(__name__)
+
+
+class GuildSettingsStore:
+    """Per-guild settings kept fully in memory so that prefix checks never await.
+
+    Guilds are queued as they become available and loaded in bulk with one query per burst of GUILD_CREATE events.
+    Until a guild is loaded, the defaults are used.
+
+    The first character of every known prefix (and of a mention) is indexed, so that most chat messages
+    are rejected by :meth:`matches` with a single set lookup.
+    """
+
+    PRELOAD_DELAY = 1
+    RETRY_DELAY = 5
+    MAX_RETRY_DELAY = 300
+
+    MAX_PREFIX_LENGTH = 10
+
+    def __init__(self, bot: Parrot, *, default: str) -> None:
+        self.bot = bot
+        self.default = default
+
+        self._prefixes: dict[int, str] = {}
+        # guilds that opted in to keeping their full member list cached
+        self._chunked_guilds: set[int] = set()
+        self._first_chars: Counter[str] = Counter({default[0]: 1, "<": 1})
+        self._pending: set[int] = set()
+        self._preload_task: asyncio.Task[None] | None = None
+
+    @property
+    def collection(self):
+        return self.bot.guild_configurations_collection
+
+    def get_prefix(self, guild_id: int, /) -> str:
+        return self._prefixes.get(guild_id, self.default)
+
+    def chunks_members(self, guild_id: int, /) -> bool:
+        return guild_id in self._chunked_guilds
+
+    def matches(self, guild_id: int, content: str, /) -> bool:
+        """Whether ``content`` could start with the guild prefix or a mention."""
+        if not content or content[0] not in self._first_chars:
+            return False
+
+        return content.startswith((self._prefixes.get(guild_id, self.default), "<@"))
+
+    def _store(self, guild_id: int, prefix: str | None) -> None:
+        old = self._prefixes.pop(guild_id, None)
+        if old is not None:
+            self._first_chars[old[0]] -= 1
+            if self._first_chars[old[0]] <= 0:
+                del self._first_chars[old[0]]
+
+        if prefix is not None:
+            self._prefixes[guild_id] = prefix
+            self._first_chars[prefix[0]] += 1
+
+    def forget(self, guild_id: int, /) -> None:
+        self._store(guild_id, None)
+        self._chunked_guilds.discard(guild_id)
+        self._pending.discard(guild_id)
+
+    async def close(self) -> None:
+        if self._preload_task is not None:
+            _ = self._preload_task.cancel()
+            _ = await asyncio.gather(self._preload_task, return_exceptions=True)
+            self._preload_task = None
+
+    def queue(self, guild_id: int, /) -> None:
+        self._pending.add(guild_id)
+        if self._preload_task is None or self._preload_task.done():
+            self._preload_task = asyncio.create_task(self._preload())
+
+    async def _preload(self) -> None:
+        # let the rest of the GUILD_CREATE burst arrive first
+        await asyncio.sleep(self.PRELOAD_DELAY)
+
+        delay = self.RETRY_DELAY
+        # guilds queued while a batch is loading are picked up by the next iteration
+        while self._pending:
+            guild_ids, self._pending = self._pending, set()
+            try:
+                await self.load(guild_ids)
+            except pymongo.errors.PyMongoError:
+                logger.warning("Could not preload settings for %s guilds, retrying in %s seconds", len(guild_ids), delay, exc_info=True)
+                self._pending |= guild_ids
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RETRY_DELAY)
+                continue
+
+            delay = self.RETRY_DELAY
+            self.bot.dispatch("guild_settings_loaded", guild_ids)
+
+    async def load(self, guild_ids: Iterable[int], /) -> None:
+        guild_ids = list(guild_ids)
+        if not guild_ids:
+            return
+
+        async for data in self.collection.find({"id": {"$in": guild_ids}}, {"_id": 0, "id": 1, "prefix": 1, "chunk_members": 1}):
+            self._store(data["id"], data.get("prefix"))
+            if data.get("chunk_members"):
+                self._chunked_guilds.add(data["id"])
+            else:
+                self._chunked_guilds.discard(data["id"])
+
+        logger.debug("Loaded settings for %s guilds", len(guild_ids))
+
+    async def set_chunk_members(self, guild_id: int, enabled: bool, /) -> None:
+        _ = await self.collection.update_one({"id": guild_id}, {"$set": {"chunk_members": enabled}}, upsert=True)
+        if enabled:
+            self._chunked_guilds.add(guild_id)
+        else:
+            self._chunked_guilds.discard(guild_id)
+
+    async def set_prefix(self, guild_id: int, prefix: str, /) -> None:
+        if not prefix or len(prefix) > self.MAX_PREFIX_LENGTH:
+            raise ValueError(f"Prefix must be between 1 and {self.MAX_PREFIX_LENGTH} characters long.")
+
+        if prefix == self.default:
+            _ = await self.collection.update_one({"id": guild_id}, {"$unset": {"prefix": ""}})
+            self._store(guild_id, None)
+            return
+
+        _ = await self.collection.update_one({"id": guild_id}, {"$set": {"prefix": prefix}}, upsert=True)
+        self._store(guild_id, prefix)
+
+    async def ensure_indexes(self) -> None:
+        _ = await self.collection.create_index([("id", pymongo.ASCENDING)], unique=True)
@@ -0,0 +1,115 @@
+"""Logging setup.
+
+Handlers that write to disk run on a :class:`logging.handlers.QueueListener` thread,
+so a log call from the event loop only appends the record to a queue.
+
+Configured through the environment:
+
+- ``LOG_LEVEL``: root level, ``INFO`` by default.
+- ``LOG_FORMAT``: ``rich`` (default) or ``json``, one object per line.
+- ``LOG_FILE``: ``parrot.log`` by default. A cluster adds its id before the suffix, ``parrot.<cluster id>.log``,
+  since the rotating handlers of several processes cannot share one file.
+- ``LOG_MAX_BYTES`` / ``LOG_BACKUP_COUNT``: rotate the file at this size, keeping this many old files.
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import pathlib
+import queue
+from typing import Any
+
+from rich.console import Console
+from rich.logging import RichHandler
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+# attributes every LogRecord has, anything else was passed through ``extra=``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, None, None, None))) | {"message", "asctime", "taskName"}
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    # the default prepare() formats the whole record, traceback included, on the calling thread.
+    # Only merge the arguments (they may not be safe to touch later) and leave the rest to the listener.
+    # The record is copied, other handlers on the way up still see the original msg and args.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class RichFileFormatter(logging.Formatter):
+    """Renders records the way :class:`RichHandler` would, as plain text for a file."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._console = Console(width=180, color_system=None, force_terminal=False, soft_wrap=True)
+        self._handler = RichHandler(console=self._console, rich_tracebacks=True, show_path=True, markup=False)
+
+    def format(self, record: logging.LogRecord) -> str:
+        # only ever called from the listener thread, so the console is not shared
+        with self._console.capture() as capture:
+            self._handler.emit(record)
+
+        return capture.get().rstrip("\n")
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                data[key] = value
+
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+def setup_logging(*, cluster_id: int | None = None) -> logging.handlers.QueueListener:
+    log_format = os.environ.get("LOG_FORMAT", "rich").lower()
+    if log_format not in {"rich", "json"}:
+        raise ValueError(f"LOG_FORMAT must be 'rich' or 'json', not {log_format!r}")
+
+    filename = pathlib.Path(os.environ.get("LOG_FILE") or "parrot.log")
+    if cluster_id is not None:
+        filename = filename.with_stem(f"{filename.stem}.{cluster_id}")
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        filename, maxBytes=int(os.environ.get("LOG_MAX_BYTES", DEFAULT_MAX_BYTES)), backupCount=int(os.environ.get("LOG_BACKUP_COUNT", DEFAULT_BACKUP_COUNT)), encoding="utf-8"
+    )
+    file_handler.setFormatter(JSONFormatter() if log_format == "json" else RichFileFormatter())
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
+    listener.start()
+    # flush whatever is still queued on a normal exit
+    atexit.register(listener.stop)
+    return listener
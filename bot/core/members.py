@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Iterable
+
+import discord
+
+from .utils import LRUCache
+
+if TYPE_CHECKING:
+    from .bot import Parrot
+
+logger = logging.getLogger(__name__)
+
+
+class MemberNameIndex:
+    """Maps case-folded usernames, global names and nicknames to member ids, per guild.
+
+    A guild is indexed from its member cache on first lookup and then kept up to date from member events,
+    so name lookups stay O(1) even in guilds with hundreds of thousands of members.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[int, dict[str, set[int]]] = {}
+        # the keys each member is currently indexed under, so updates can unindex the old names
+        self._keys: dict[int, dict[int, tuple[str, ...]]] = {}
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._names
+
+    @staticmethod
+    def _keys_of(member: discord.Member) -> tuple[str, ...]:
+        names = (member.name, member.global_name, member.nick)
+        return tuple({name.casefold() for name in names if name})
+
+    def build(self, guild: discord.Guild, /) -> None:
+        self._names[guild.id] = {}
+        self._keys[guild.id] = {}
+
+        for member in guild.members:
+            self.add(member)
+
+    def add(self, member: discord.Member, /) -> None:
+        names = self._names.get(member.guild.id)
+        if names is None:
+            # not built yet, the member will be picked up from the cache when it is
+            return
+
+        self.remove(member.guild.id, member.id)
+
+        keys = self._keys_of(member)
+        self._keys[member.guild.id][member.id] = keys
+        for key in keys:
+            names.setdefault(key, set()).add(member.id)
+
+    def remove(self, guild_id: int, member_id: int, /) -> None:
+        names = self._names.get(guild_id)
+        if names is None:
+            return
+
+        for key in self._keys[guild_id].pop(member_id, ()):
+            ids = names.get(key)
+            if ids is None:
+                continue
+
+            ids.discard(member_id)
+            if not ids:
+                del names[key]
+
+    def forget(self, guild_id: int, /) -> None:
+        self._names.pop(guild_id, None)
+        self._keys.pop(guild_id, None)
+
+    def lookup(self, guild: discord.Guild, name: str, /) -> list[discord.Member]:
+        if guild.id not in self._names:
+            self.build(guild)
+
+        ids = self._names[guild.id].get(name.casefold(), ())
+        return [member for member in map(guild.get_member, ids) if member is not None]
+
+
+class MemberResolver:
+    """Fetches just the members a command needs over the gateway instead of chunking the whole guild.
+
+    Lookups by id that arrive within ``BATCH_DELAY`` of each other are sent as one ``query_members`` request,
+    concurrent identical name searches share one request, and results (including misses) are cached briefly.
+    """
+
+    BATCH_DELAY = 0.05
+    # gateway limit for `user_ids` in a single request
+    BATCH_SIZE = 100
+
+    SEARCH_LIMIT = 10
+    SEARCH_TTL = 60
+    MISSING_TTL = 60
+
+    def __init__(self, bot: Parrot) -> None:
+        self.bot = bot
+        self.index = MemberNameIndex()
+
+        self._pending: dict[int, dict[int, asyncio.Future[discord.Member | None]]] = {}
+        self._flushers: dict[int, asyncio.Task[None]] = {}
+        self._queries: set[asyncio.Task[None]] = set()
+
+        self._searches: LRUCache[tuple[int, str], list[int]] = LRUCache(maxsize=1024, ttl=self.SEARCH_TTL)
+        self._inflight_searches: dict[tuple[int, str], asyncio.Task[list[discord.Member]]] = {}
+        self._missing: LRUCache[tuple[int, int], bool] = LRUCache(maxsize=4096, ttl=self.MISSING_TTL)
+
+    async def fetch(self, guild: discord.Guild, user_id: int, /) -> discord.Member | None:
+        member = guild.get_member(user_id)
+        if member is not None:
+            return member
+
+        if (guild.id, user_id) in self._missing:
+            return None
+
+        pending = self._pending.setdefault(guild.id, {})
+        future = pending.get(user_id)
+        if future is None:
+            future = pending[user_id] = asyncio.get_running_loop().create_future()
+
+            if len(pending) >= self.BATCH_SIZE:
+                del self._pending[guild.id]
+                task = asyncio.create_task(self._query(guild, pending))
+                self._queries.add(task)
+                task.add_done_callback(self._queries.discard)
+            elif guild.id not in self._flushers:
+                self._flushers[guild.id] = asyncio.create_task(self._flush_later(guild))
+
+        return await asyncio.shield(future)
+
+    async def fetch_many(self, guild: discord.Guild, user_ids: Iterable[int], /) -> dict[int, discord.Member]:
+        user_ids = list(dict.fromkeys(user_ids))
+        members = await asyncio.gather(*(self.fetch(guild, user_id) for user_id in user_ids))
+        return {user_id: member for user_id, member in zip(user_ids, members) if member is not None}
+
+    async def close(self) -> None:
+        tasks = [*self._flushers.values(), *self._queries, *self._inflight_searches.values()]
+        for task in tasks:
+            _ = task.cancel()
+
+        _ = await asyncio.gather(*tasks, return_exceptions=True)
+        # batches whose flusher was cancelled before it got to query them
+        for pending in self._pending.values():
+            for future in pending.values():
+                if not future.done():
+                    future.set_result(None)
+
+        self._pending.clear()
+        self._flushers.clear()
+
+    async def _flush_later(self, guild: discord.Guild) -> None:
+        await asyncio.sleep(self.BATCH_DELAY)
+
+        del self._flushers[guild.id]
+        pending = self._pending.pop(guild.id, None)
+        if pending:
+            await self._query(guild, pending)
+
+    async def _query(self, guild: discord.Guild, pending: dict[int, asyncio.Future[discord.Member | None]]) -> None:
+        members: list[discord.Member] = []
+        try:
+            members = await guild.query_members(user_ids=list(pending), limit=len(pending), cache=True)
+        except (asyncio.TimeoutError, discord.ClientException):
+            logger.warning("Querying %s members of guild_id=%s failed", len(pending), guild.id, exc_info=True)
+        else:
+            found = {member.id for member in members}
+            for user_id in pending.keys() - found:
+                self._missing.set((guild.id, user_id), True)
+
+            for member in members:
+                self.index.add(member)
+        finally:
+            # whatever went wrong (a reconnect, a cancellation), nobody may be left waiting on a future
+            by_id = {member.id: member for member in members}
+            for user_id, future in pending.items():
+                if not future.done():
+                    future.set_result(by_id.get(user_id))
+
+    async def search(self, guild: discord.Guild, query: str, /, *, limit: int = SEARCH_LIMIT) -> list[discord.Member]:
+        """Members whose username or nickname starts with ``query`` (case-insensitive)."""
+        key = (guild.id, query.casefold())
+
+        cached: list[int] | None = self._searches.get(key, None)
+        if cached is not None:
+            return [member for member in map(guild.get_member, cached) if member is not None]
+
+        task = self._inflight_searches.get(key)
+        if task is None:
+            task = self._inflight_searches[key] = asyncio.create_task(guild.query_members(query=query, limit=limit, cache=True))
+            task.add_done_callback(lambda _: self._inflight_searches.pop(key, None))
+
+        try:
+            members = await asyncio.shield(task)
+        except (asyncio.TimeoutError, discord.ClientException):
+            logger.warning("Searching members of guild_id=%s for %r failed", guild.id, query, exc_info=True)
+            return []
+
+        self._searches.set(key, [member.id for member in members])
+        for member in members:
+            self.index.add(member)
+
+        return members
+
+    def forget(self, guild_id: int, user_id: int, /) -> None:
+        self._missing.pop((guild_id, user_id))
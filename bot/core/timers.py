@@ -0,0 +1,663 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import heapq
+import itertools
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, NotRequired, TypedDict, cast
+
+import arrow
+import discord
+import pymongo
+import pymongo.errors
+import redis.exceptions
+from bson import ObjectId, json_util
+from discord.utils import maybe_coroutine
+
+if TYPE_CHECKING:
+    from .bot import Parrot
+
+logger = logging.getLogger(__name__)
+
+
+class TimerConfig(TypedDict):
+    _id: NotRequired[ObjectId]
+    event_name: str
+    created_at: datetime.datetime
+    due_date: datetime.datetime
+    # set on overdue timers while a catch-up replays them
+    claimed: NotRequired[bool]
+
+    metadata: dict[str, Any]
+
+
+def get_timer_id(timer: TimerConfig) -> ObjectId:
+    """The id of a timer that has been stored, which every timer a scheduler hands out has."""
+    timer_id = timer.get("_id")
+    if timer_id is None:
+        raise KeyError("_id")
+
+    return timer_id
+
+
+class BaseTimerScheduler(ABC):
+    RETRY_DELAY = 5
+
+    def __init__(self, bot: Parrot) -> None:
+        self.bot = bot
+        self._wakeup = asyncio.Event()
+
+    @abstractmethod
+    async def add(self, timer: TimerConfig) -> None: ...
+
+    @abstractmethod
+    async def remove(self, timer_id: ObjectId) -> bool: ...
+
+    @abstractmethod
+    async def ack(self, timer: TimerConfig) -> None:
+        """Forget a timer that :meth:`Parrot.call_timer` has dispatched and every listener of has returned."""
+
+    @abstractmethod
+    async def get_active_timer(self) -> TimerConfig | None: ...
+
+    @abstractmethod
+    async def run(self) -> None: ...
+
+    async def close(self) -> None:
+        """Stop the background work started outside of :meth:`run`."""
+
+    async def prefetch_user_settings(self, timers: list[TimerConfig]) -> None:
+        """Warm the user settings cache for a batch of timers with one query, so listeners never wait on Mongo."""
+        user_ids = {user_id for timer in timers if (user_id := (timer.get("metadata") or {}).get("user_id")) is not None}
+        if not user_ids:
+            return
+
+        try:
+            _ = await self.bot.get_timezones(user_ids)
+        except pymongo.errors.PyMongoError:
+            logger.warning("Could not prefetch user settings for %s timers", len(timers), exc_info=True)
+
+    async def _sleep_until(self, due: float) -> bool:
+        """Sleep until ``due``. Returns ``False`` if woken up early by an earlier timer."""
+        self._wakeup.clear()
+        delay = due - arrow.utcnow().timestamp()
+        if delay <= 0:
+            return True
+
+        try:
+            _ = await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            return True
+
+        return False
+
+
+class TimerScheduler(BaseTimerScheduler):
+    """Keeps a bounded window of the upcoming persisted timers in an in-process heap.
+
+    The heap holds every timer due at or before ``horizon``. Timers past the horizon only live in Mongo
+    and are pulled in, ``BATCH_SIZE`` at a time, once the heap runs dry.
+    """
+
+    BATCH_SIZE = 128
+    MAX_WINDOW = BATCH_SIZE * 4
+
+    # overdue timers replayed after downtime are spread out to stay clear of Discord's rate limits
+    CATCH_UP_CHANNEL_INTERVAL = 1
+    CATCH_UP_GLOBAL_RATE = 25
+
+    UNCLAIMED = {"claimed": {"$ne": True}}
+
+    def __init__(self, bot: Parrot) -> None:
+        super().__init__(bot)
+
+        self._needs_catch_up = True
+        self._catch_up_tasks: set[asyncio.Task[None]] = set()
+        # claimed by a catch-up of this process and not dispatched yet
+        self._catching_up: set[ObjectId] = set()
+
+        self._heap: list[tuple[float, int, TimerConfig]] = []
+        self._ids: set[ObjectId] = set()
+        self._cancelled: set[ObjectId] = set()
+        self._counter = itertools.count()
+
+        # `math.inf` means every persisted timer is in the heap
+        self._horizon: float = math.inf
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def collection(self):
+        return self.bot.timer_collection
+
+    def peek(self) -> TimerConfig | None:
+        while self._heap:
+            _, _, timer = self._heap[0]
+            if timer.get("_id") not in self._cancelled:
+                return timer
+
+            _ = heapq.heappop(self._heap)
+            self._cancelled.discard(get_timer_id(timer))
+
+        return None
+
+    def push(self, timer: TimerConfig) -> None:
+        timer_id = timer.get("_id")
+        if timer_id is None or timer_id in self._ids:
+            return
+
+        due = timer["due_date"].timestamp()
+        if due > self._horizon:
+            # will be picked up by a later refill
+            return
+
+        head = self._heap[0][0] if self._heap else math.inf
+        heapq.heappush(self._heap, (due, next(self._counter), timer))
+        self._ids.add(timer_id)
+        self._cancelled.discard(timer_id)
+
+        if len(self._heap) > self.MAX_WINDOW:
+            self._trim()
+
+        if due < head:
+            self._wakeup.set()
+
+    def discard(self, timer_id: ObjectId) -> None:
+        if timer_id in self._ids:
+            self._ids.remove(timer_id)
+            self._cancelled.add(timer_id)
+
+    def _trim(self) -> None:
+        keep = heapq.nsmallest(self.BATCH_SIZE, (entry for entry in self._heap if entry[2].get("_id") not in self._cancelled))
+        # a sorted list is already a valid heap
+        self._heap = keep
+        self._ids = {get_timer_id(timer) for _, _, timer in keep}
+        self._cancelled.clear()
+        self._horizon = keep[-1][0] if keep else math.inf
+
+    def reset(self) -> None:
+        self._heap.clear()
+        self._ids.clear()
+        self._cancelled.clear()
+        self._horizon = math.inf
+
+    async def close(self) -> None:
+        # replayed timers that were not dispatched yet stay claimed, the next catch-up picks them up
+        for task in self._catch_up_tasks:
+            _ = task.cancel()
+
+        _ = await asyncio.gather(*self._catch_up_tasks, return_exceptions=True)
+
+    async def ensure_indexes(self) -> None:
+        _ = await self.collection.create_index([("due_date", pymongo.ASCENDING)])
+
+    async def refill(self) -> None:
+        cursor = self.collection.find(self.UNCLAIMED, sort=[("due_date", pymongo.ASCENDING)], limit=self.BATCH_SIZE)
+        timers: list[TimerConfig] = await cursor.to_list(length=None)
+
+        self._horizon = math.inf if len(timers) < self.BATCH_SIZE else timers[-1]["due_date"].timestamp()
+        for timer in timers:
+            self.push(timer)
+
+        logger.debug("Refilled timer heap with %s timers (horizon=%s)", len(timers), self._horizon)
+
+    def _pop_due(self, now: float) -> list[TimerConfig]:
+        head, _, _ = self._heap[0]
+        # everything sharing the head's due second goes out in the same pass
+        cutoff = max(now, math.floor(head) + 1 - 1e-6)
+
+        due: list[TimerConfig] = []
+        while self._heap and self._heap[0][0] <= cutoff:
+            _, _, timer = heapq.heappop(self._heap)
+            timer_id = get_timer_id(timer)
+            if timer_id in self._cancelled:
+                self._cancelled.discard(timer_id)
+                continue
+
+            self._ids.discard(timer_id)
+            due.append(timer)
+
+        return due
+
+    async def add(self, timer: TimerConfig) -> None:
+        _ = await self.collection.insert_one(timer)
+        self.push(timer)
+
+    async def remove(self, timer_id: ObjectId) -> bool:
+        self.discard(timer_id)
+        # keeps a catch-up that is still replaying it from dispatching it
+        self._catching_up.discard(timer_id)
+        delete_result = await self.collection.delete_one({"_id": timer_id})
+        return delete_result.deleted_count > 0
+
+    async def ack(self, timer: TimerConfig) -> None:
+        _ = await self.remove(get_timer_id(timer))
+
+    async def get_active_timer(self) -> TimerConfig | None:
+        timer = self.peek()
+        if timer is not None:
+            return timer
+
+        return await self.collection.find_one(self.UNCLAIMED, sort=[("due_date", pymongo.ASCENDING)])
+
+    async def catch_up(self) -> int:
+        """Pull every overdue timer in one pass and replay them in the background. Returns how many were found.
+
+        The timers are only marked claimed, which keeps them out of the heap, and each one is deleted after it
+        has been dispatched. Claimed timers are still overdue, so the catch-up after a restart picks up
+        whatever this one did not get to.
+        """
+        overdue = {"due_date": {"$lte": arrow.utcnow().datetime}}
+
+        cursor = self.collection.find(overdue, sort=[("due_date", pymongo.ASCENDING)], batch_size=1000)
+        # a catch-up after a connection error must not replay what an earlier one is still replaying
+        timers: list[TimerConfig] = [timer for timer in await cursor.to_list(length=None) if timer.get("_id") not in self._catching_up]
+        if not timers:
+            return 0
+
+        timer_ids = [get_timer_id(timer) for timer in timers]
+        # tracked before claiming, so a timer cancelled while the claim is in flight is not replayed
+        self._catching_up.update(timer_ids)
+        try:
+            _ = await self.collection.update_many({"_id": {"$in": timer_ids}}, {"$set": {"claimed": True}})
+        except pymongo.errors.PyMongoError:
+            self._catching_up.difference_update(timer_ids)
+            raise
+
+        task = asyncio.create_task(self._fan_out(timers))
+        self._catch_up_tasks.add(task)
+        task.add_done_callback(self._catch_up_tasks.discard)
+
+        logger.info("Catching up on %s overdue timers", len(timers))
+        return len(timers)
+
+    async def _fan_out(self, timers: list[TimerConfig]) -> None:
+        await self.bot.wait_until_ready()
+        await self.prefetch_user_settings(timers)
+
+        groups: defaultdict[Any, list[TimerConfig]] = defaultdict(list)
+        for timer in timers:
+            channel_id = (timer.get("metadata") or {}).get("channel_id")
+            groups[channel_id or get_timer_id(timer)].append(timer)
+
+        # a slot is held for one interval, so channels are drained one timer per interval
+        # and at most `CATCH_UP_GLOBAL_RATE` timers go out per interval across all of them
+        limiter = asyncio.Semaphore(self.CATCH_UP_GLOBAL_RATE)
+        dispatched: list[ObjectId] = []
+
+        async def delete_dispatched() -> None:
+            if not dispatched:
+                return
+
+            timer_ids = dispatched.copy()
+            dispatched.clear()
+            try:
+                _ = await self.collection.delete_many({"_id": {"$in": timer_ids}})
+            except pymongo.errors.PyMongoError:
+                logger.warning("Could not delete %s replayed timers, retrying with the next batch", len(timer_ids), exc_info=True)
+                dispatched.extend(timer_ids)
+                return
+
+            self._catching_up.difference_update(timer_ids)
+
+        async def drain(channel_timers: list[TimerConfig]) -> None:
+            for timer in channel_timers:
+                timer_id = get_timer_id(timer)
+                if timer_id not in self._catching_up:
+                    continue
+
+                async with limiter:
+                    # cancelled while waiting for a slot
+                    if timer_id not in self._catching_up:
+                        continue
+
+                    self.bot.dispatch(timer["event_name"], timer)
+                    dispatched.append(timer_id)
+                    await asyncio.sleep(self.CATCH_UP_CHANNEL_INTERVAL)
+
+                # every drain wakes up at about the same time, the first one deletes the whole interval's batch
+                await delete_dispatched()
+
+        try:
+            _ = await asyncio.gather(*(drain(channel_timers) for channel_timers in groups.values()))
+        finally:
+            await delete_dispatched()
+
+    async def fire(self, timers: list[TimerConfig]) -> None:
+        if not timers:
+            return
+
+        _ = await self.collection.delete_many({"_id": {"$in": [get_timer_id(timer) for timer in timers]}})
+        await self.prefetch_user_settings(timers)
+        for timer in timers:
+            self.bot.dispatch(timer["event_name"], timer)
+
+    async def run(self) -> None:
+        await self.ensure_indexes()
+
+        while not self.bot.is_closed():
+            try:
+                if self._needs_catch_up:
+                    _ = await self.catch_up()
+                    self._needs_catch_up = False
+
+                if self.peek() is None:
+                    self.reset()
+                    await self.refill()
+
+                head = self.peek()
+                if head is None:
+                    self._wakeup.clear()
+                    _ = await self._wakeup.wait()
+                    continue
+
+                if not await self._sleep_until(head["due_date"].timestamp()):
+                    continue
+
+                await self.fire(self._pop_due(arrow.utcnow().timestamp()))
+
+            except (OSError, discord.ConnectionClosed, pymongo.errors.ConnectionFailure):
+                logger.exception("Timer dispatch failed, retrying in %s seconds", self.RETRY_DELAY)
+                self.reset()
+                self._needs_catch_up = True
+                await asyncio.sleep(self.RETRY_DELAY)
+
+
+# KEYS: pending zset, leases zset, payload hash
+# ARGV: now, lease deadline, max timers to claim
+CLAIM_TIMERS_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for _, timer_id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], timer_id)
+    redis.call('ZADD', KEYS[1], ARGV[1], timer_id)
+end
+
+local claimed = {}
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])
+for _, timer_id in ipairs(due) do
+    redis.call('ZREM', KEYS[1], timer_id)
+    local payload = redis.call('HGET', KEYS[3], timer_id)
+    if payload then
+        redis.call('ZADD', KEYS[2], ARGV[2], timer_id)
+        table.insert(claimed, payload)
+    end
+end
+return claimed
+"""
+
+
+class RedisTimerScheduler(BaseTimerScheduler):
+    """Timer backend on Redis sorted sets that any number of bot processes can share.
+
+    Due timers are atomically moved from the pending set to a lease set by a Lua script and each one is handed
+    to :meth:`Parrot.call_timer` in its own task, which acknowledges it once every listener of its event has returned.
+    A process that dies before acknowledging leaves its lease to expire, after which the timer goes back
+    to pending and is claimed again, so every timer is delivered at least once. Listeners must therefore
+    tolerate a repeat, and finish within ``LEASE_SECONDS``.
+
+    At most ``MAX_IN_FLIGHT`` timers are dispatched at a time and only as many are claimed as can start
+    right away, so a slow listener holds up its own timer and nothing else.
+    """
+
+    PENDING_KEY = "timers:pending"
+    LEASES_KEY = "timers:leases"
+    PAYLOADS_KEY = "timers:payloads"
+
+    MAX_IN_FLIGHT = 100
+    MIGRATE_BATCH_SIZE = 500
+    LEASE_SECONDS = 60
+    # upper bound on how late a timer created by another process can be noticed
+    POLL_INTERVAL = 1
+
+    JSON_OPTIONS = json_util.RELAXED_JSON_OPTIONS.with_options(tz_aware=True, tzinfo=datetime.timezone.utc)
+
+    def __init__(self, bot: Parrot) -> None:
+        super().__init__(bot)
+        self._claim_script = self.redis.register_script(CLAIM_TIMERS_SCRIPT)
+        self._dispatching: set[asyncio.Task[None]] = set()
+
+    @property
+    def redis(self):
+        return self.bot.redis_client
+
+    def _dumps(self, timer: TimerConfig) -> str:
+        return json_util.dumps(timer, json_options=self.JSON_OPTIONS)
+
+    def _loads(self, payload: str) -> TimerConfig:
+        return json_util.loads(payload, json_options=self.JSON_OPTIONS)
+
+    async def add(self, timer: TimerConfig) -> None:
+        timer_id = str(timer.setdefault("_id", ObjectId()))
+        due = timer["due_date"].timestamp()
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            _ = pipe.hset(self.PAYLOADS_KEY, timer_id, self._dumps(timer))
+            _ = pipe.zadd(self.PENDING_KEY, {timer_id: due})
+            _ = await pipe.execute()
+
+        self._wakeup.set()
+
+    async def remove(self, timer_id: ObjectId) -> bool:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            _ = pipe.zrem(self.PENDING_KEY, str(timer_id))
+            _ = pipe.zrem(self.LEASES_KEY, str(timer_id))
+            _ = pipe.hdel(self.PAYLOADS_KEY, str(timer_id))
+            removed_pending, removed_leased, _ = cast(list[int], await pipe.execute())
+
+        return bool(removed_pending or removed_leased)
+
+    async def get_active_timer(self) -> TimerConfig | None:
+        head = cast(list[str], await maybe_coroutine(self.redis.zrange, self.PENDING_KEY, 0, 0))
+        if not head:
+            return None
+
+        payload = cast(str | None, await maybe_coroutine(self.redis.hget, self.PAYLOADS_KEY, head[0]))
+        return None if payload is None else self._loads(payload)
+
+    async def close(self) -> None:
+        # cancelled timers stay leased, they are claimed again once the lease expires
+        for task in self._dispatching:
+            _ = task.cancel()
+
+        _ = await asyncio.gather(*self._dispatching, return_exceptions=True)
+
+    async def claim(self, limit: int) -> list[TimerConfig]:
+        now = arrow.utcnow().timestamp()
+        payloads = cast(list[str], await self._claim_script(keys=[self.PENDING_KEY, self.LEASES_KEY, self.PAYLOADS_KEY], args=[now, now + self.LEASE_SECONDS, limit]))
+        return [self._loads(payload) for payload in payloads]
+
+    async def ack(self, timer: TimerConfig) -> None:
+        timer_id = str(get_timer_id(timer))
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            _ = pipe.zrem(self.LEASES_KEY, timer_id)
+            _ = pipe.hdel(self.PAYLOADS_KEY, timer_id)
+            _ = await pipe.execute()
+
+    async def dispatch(self, timer: TimerConfig) -> None:
+        try:
+            await self.bot.call_timer(timer)
+        except (OSError, redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+            logger.warning("Could not acknowledge timer %s, it is dispatched again once its lease expires", timer.get("_id"), exc_info=True)
+
+    async def migrate_from_mongo(self) -> int:
+        """Move the timers left in Mongo by the single process backend into Redis. Returns how many were moved.
+
+        Only cluster 0 runs this, so two processes never move the same timer, which could deliver it twice.
+        A timer is deleted from Mongo only after it is in Redis, and re-adding one is a no-op,
+        so an interrupted migration simply continues on the next start.
+        """
+        moved = 0
+        cursor = self.bot.timer_collection.find({}, batch_size=self.MIGRATE_BATCH_SIZE)
+        batch: list[TimerConfig] = []
+
+        async def flush() -> None:
+            nonlocal moved
+            timer_ids = [get_timer_id(timer) for timer in batch]
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for timer_id, timer in zip(timer_ids, batch):
+                    _ = pipe.hsetnx(self.PAYLOADS_KEY, str(timer_id), self._dumps(timer))
+                    _ = pipe.zadd(self.PENDING_KEY, {str(timer_id): timer["due_date"].timestamp()}, nx=True)
+                _ = await pipe.execute()
+
+            _ = await self.bot.timer_collection.delete_many({"_id": {"$in": timer_ids}})
+            moved += len(batch)
+            batch.clear()
+
+        async for document in cursor:
+            timer = cast(TimerConfig, document)
+            # only meaningful to the Mongo backend's catch-up
+            _ = timer.pop("claimed", None)
+            batch.append(timer)
+            if len(batch) >= self.MIGRATE_BATCH_SIZE:
+                await flush()
+
+        if batch:
+            await flush()
+
+        if moved:
+            logger.info("Moved %s timers from Mongo to Redis", moved)
+            self._wakeup.set()
+
+        return moved
+
+    async def _next_due(self) -> float:
+        now = arrow.utcnow().timestamp()
+        head = cast(list[tuple[str, float]], await maybe_coroutine(self.redis.zrange, self.PENDING_KEY, 0, 0, withscores=True))
+        leases = cast(list[tuple[str, float]], await maybe_coroutine(self.redis.zrange, self.LEASES_KEY, 0, 0, withscores=True))
+
+        due = min([score for _, score in head + leases], default=now + self.POLL_INTERVAL)
+        return min(due, now + self.POLL_INTERVAL)
+
+    async def run(self) -> None:
+        if self.bot.cluster_id == 0:
+            try:
+                _ = await self.migrate_from_mongo()
+            except (OSError, pymongo.errors.PyMongoError, redis.exceptions.ConnectionError):
+                logger.exception("Could not move timers from Mongo to Redis, they stay in Mongo until the next start")
+
+        while not self.bot.is_closed():
+            try:
+                free = self.MAX_IN_FLIGHT - len(self._dispatching)
+                if free <= 0:
+                    _ = await asyncio.wait(self._dispatching, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                timers = await self.claim(free)
+                if timers:
+                    await self.prefetch_user_settings(timers)
+                    for timer in timers:
+                        task = asyncio.create_task(self.dispatch(timer))
+                        self._dispatching.add(task)
+                        task.add_done_callback(self._dispatching.discard)
+
+                    continue
+
+                _ = await self._sleep_until(await self._next_due())
+
+            except (OSError, redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+                logger.exception("Timer dispatch failed, retrying in %s seconds", self.RETRY_DELAY)
+                await asyncio.sleep(self.RETRY_DELAY)
+
+
+class TimingWheel:
+    """Hashed timing wheel holding every short, non-persisted timer behind a single driver task.
+
+    Timers land in the bucket of their due tick, so scheduling and cancelling are O(1) and a timer
+    fires at most ``TICK`` seconds late. Deadlines further than one revolution away stay in their
+    bucket until the wheel has turned enough times.
+    """
+
+    TICK = 0.25
+    SLOTS = 256
+
+    def __init__(self, bot: Parrot, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.bot = bot
+        self._clock = clock
+
+        self._buckets: list[dict[ObjectId, tuple[int, TimerConfig]]] = [{} for _ in range(self.SLOTS)]
+        self._slots: dict[ObjectId, int] = {}
+
+        self._origin = clock()
+        self._current_tick = 0
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, timer_id: ObjectId) -> bool:
+        return timer_id in self._slots
+
+    def _tick_for(self, due_date: datetime.datetime) -> int:
+        delay = max((due_date - arrow.utcnow().datetime).total_seconds(), 0)
+        elapsed = self._clock() - self._origin
+        return max(math.ceil((elapsed + delay) / self.TICK), self._current_tick + 1)
+
+    def schedule(self, timer: TimerConfig) -> ObjectId:
+        timer_id = timer.setdefault("_id", ObjectId())
+        self.cancel(timer_id)
+
+        tick = self._tick_for(timer["due_date"])
+        slot = tick % self.SLOTS
+        self._buckets[slot][timer_id] = (tick, timer)
+        self._slots[timer_id] = slot
+
+        self._wakeup.set()
+        return timer_id
+
+    def cancel(self, timer_id: ObjectId) -> TimerConfig | None:
+        slot = self._slots.pop(timer_id, None)
+        if slot is None:
+            return None
+
+        _, timer = self._buckets[slot].pop(timer_id)
+        return timer
+
+    def _advance(self, tick: int) -> list[TimerConfig]:
+        due: list[TimerConfig] = []
+        # if the loop stalled, sweep every bucket we skipped over (at most one revolution)
+        start = max(self._current_tick + 1, tick - self.SLOTS + 1)
+        for current in range(start, tick + 1):
+            bucket = self._buckets[current % self.SLOTS]
+            for timer_id, (deadline, timer) in list(bucket.items()):
+                if deadline <= tick:
+                    del bucket[timer_id]
+                    del self._slots[timer_id]
+                    due.append(timer)
+
+        self._current_tick = tick
+        return due
+
+    def _elapsed_ticks(self) -> int:
+        return int((self._clock() - self._origin) / self.TICK)
+
+    def _resync(self) -> None:
+        # resync so an idle wheel does not have to sweep the ticks it slept through, but never past a
+        # queued deadline: _advance only sweeps forward, a skipped tick would wait a whole revolution
+        # (the timer that woke us may already be cancelled, hence the default)
+        earliest = min((deadline for bucket in self._buckets for deadline, _ in bucket.values()), default=self._current_tick)
+        self._current_tick = max(self._current_tick, min(self._elapsed_ticks(), earliest) - 1)
+
+    def _turn(self) -> list[TimerConfig]:
+        """Advance by at least one tick, up to the current one, and return the timers that came due."""
+        return self._advance(max(self._elapsed_ticks(), self._current_tick + 1))
+
+    async def run(self) -> None:
+        while not self.bot.is_closed():
+            if not self._slots:
+                self._wakeup.clear()
+                _ = await self._wakeup.wait()
+                self._resync()
+                continue
+
+            next_tick = self._current_tick + 1
+            await asyncio.sleep(max(self._origin + next_tick * self.TICK - self._clock(), 0))
+
+            for timer in self._turn():
+                self.bot.dispatch(timer["event_name"], timer)
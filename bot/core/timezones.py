@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+import heapq
+import re
+from typing import Iterable, Mapping, NamedTuple
+
+from dateutil.zoneinfo import get_zonefile_instance
+from rapidfuzz import fuzz, process, utils
+
+from .utils import TimeZone
+
+UTC_OFFSET_REGEX = re.compile(r"(?:utc|gmt)?\s*(?P<sign>[+-])?\s*(?P<hours>\d{1,2})(?:[:.]?(?P<minutes>\d{2}))?", re.IGNORECASE)
+
+
+def parse_utc_offset(text: str, /) -> datetime.timedelta:
+    """Parse ``UTC+5:30``, ``+0530``, ``-4`` and the like."""
+    text = text.strip()
+    if text.casefold() in {"utc", "gmt", "z"}:
+        return datetime.timedelta(0)
+
+    match = UTC_OFFSET_REGEX.fullmatch(text)
+    if match is None:
+        raise ValueError(f"{text!r} is not a UTC offset")
+
+    offset = datetime.timedelta(hours=int(match["hours"]), minutes=int(match["minutes"] or 0))
+    if offset > datetime.timedelta(hours=14) or int(match["minutes"] or 0) >= 60:
+        raise ValueError(f"{text!r} is not a UTC offset")
+
+    return -offset if match["sign"] == "-" else offset
+
+
+def format_utc_offset(offset: datetime.timedelta, /) -> str:
+    minutes = int(offset.total_seconds()) // 60
+    sign = "-" if minutes < 0 else "+"
+    hours, minutes = divmod(abs(minutes), 60)
+    return f"UTC{sign}{hours:02}:{minutes:02}"
+
+
+class TimezoneIndex:
+    """Fuzzy search over IANA zones and their human readable aliases.
+
+    Choices are normalised once when the index is built, so a query only normalises itself and hands
+    the whole choice list to rapidfuzz in a single call. Popular zones get a small score boost,
+    which is what usually decides between "Kolkata, India" and a dozen equally close matches.
+    """
+
+    LIMIT = 25  # the most choices an autocomplete can show
+    SCORE_CUTOFF = 60
+    POPULAR_BOOST = 8
+
+    def __init__(self) -> None:
+        self._entries: list[TimeZone] = []
+        self._choices: list[str] = []
+        # entries from here on are IANA zones, everything before it is an alias
+        self._zones_start = 0
+        self._popular: frozenset[str] = frozenset()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return utils.default_process(text.replace("_", " ").replace("/", " "))
+
+    def rebuild(self, *, zones: Iterable[str], aliases: Mapping[str, str], popular: Iterable[str] = ()) -> None:
+        entries = [TimeZone(label=label, key=key) for label, key in aliases.items()]
+        zones_start = len(entries)
+        entries += [TimeZone(label=zone, key=zone) for zone in sorted(zones)]
+
+        self._entries = entries
+        self._choices = [self.normalize(entry.label) for entry in entries]
+        self._zones_start = zones_start
+        self._popular = frozenset(popular)
+
+    def popular(self, *, limit: int = LIMIT) -> list[TimeZone]:
+        return [TimeZone(label=key, key=key) for key in sorted(self._popular)[:limit]]
+
+    def search(self, query: str, /, *, limit: int = LIMIT) -> list[TimeZone]:
+        normalized = self.normalize(query)
+        if not normalized:
+            return self.popular(limit=limit)
+
+        # "America/New" can only mean a zone, so skip the aliases
+        offset = self._zones_start if "/" in query else 0
+        results = process.extract(normalized, self._choices[offset:], scorer=fuzz.WRatio, processor=None, limit=None, score_cutoff=self.SCORE_CUTOFF)
+
+        ranked = sorted(((score + self.POPULAR_BOOST * (self._entries[offset + i].key in self._popular), -i, offset + i) for _, score, i in results), reverse=True)
+
+        found: list[TimeZone] = []
+        seen: set[str] = set()
+        for _, _, i in ranked:
+            entry = self._entries[i]
+            if entry.key in seen:
+                continue
+
+            seen.add(entry.key)
+            found.append(entry)
+            if len(found) >= limit:
+                break
+
+        return found
+
+
+class ZoneOffset(NamedTuple):
+    key: str
+    offset: datetime.timedelta
+    abbreviation: str
+    dst: bool
+    # ``None`` when the zone has no transitions left
+    next_transition: datetime.datetime | None
+
+    def now(self, utcnow: datetime.datetime | None = None, /) -> datetime.datetime:
+        utcnow = utcnow or datetime.datetime.now(datetime.timezone.utc)
+        return utcnow.astimezone(datetime.timezone(self.offset, self.abbreviation))
+
+
+class TimezoneOffsetTable:
+    """Current UTC offset, abbreviation and next transition of every zone.
+
+    An entry only changes at a transition, so entries are kept in a heap ordered by their next transition
+    and every read first recomputes the (usually zero) zones whose transition has passed.
+    Reads are then dictionary lookups with no tz arithmetic.
+    """
+
+    def __init__(self) -> None:
+        self._zones: dict[str, ZoneOffset] = {}
+        self._by_offset: dict[datetime.timedelta, set[str]] = {}
+        self._transitions: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._zones
+
+    @staticmethod
+    def _compute(key: str, tz: datetime.tzinfo, now: datetime.datetime) -> ZoneOffset:
+        local = now.astimezone(tz)
+
+        next_transition: datetime.datetime | None = None
+        # dateutil's tzfile keeps its transitions as sorted UTC timestamps, it has no public accessor for them
+        transitions: list[int] | None = getattr(tz, "_trans_list_utc", None)
+        if transitions is not None:
+            i = bisect.bisect_right(transitions, now.timestamp())
+            if i < len(transitions):
+                next_transition = datetime.datetime.fromtimestamp(transitions[i], datetime.timezone.utc)
+
+        return ZoneOffset(
+            key=key, offset=local.utcoffset() or datetime.timedelta(0), abbreviation=local.tzname() or key, dst=bool(local.dst()), next_transition=next_transition
+        )
+
+    def _store(self, entry: ZoneOffset) -> None:
+        old = self._zones.get(entry.key)
+        if old is not None:
+            self._by_offset[old.offset].discard(entry.key)
+
+        self._zones[entry.key] = entry
+        self._by_offset.setdefault(entry.offset, set()).add(entry.key)
+        if entry.next_transition is not None:
+            heapq.heappush(self._transitions, (entry.next_transition.timestamp(), entry.key))
+
+    def build(self, zones: Iterable[str], /, *, now: datetime.datetime | None = None) -> None:
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        zonefile = get_zonefile_instance()
+
+        self._zones.clear()
+        self._by_offset.clear()
+        self._transitions.clear()
+
+        for key in zones:
+            tz = zonefile.get(key)
+            if tz is not None:
+                self._store(self._compute(key, tz, now))
+
+    def refresh(self, *, now: datetime.datetime | None = None) -> int:
+        """Recompute the zones whose next transition has passed. Returns how many were recomputed."""
+        if not self._transitions:
+            return 0
+
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        timestamp = now.timestamp()
+
+        refreshed = 0
+        zonefile = get_zonefile_instance()
+        while self._transitions and self._transitions[0][0] <= timestamp:
+            _, key = heapq.heappop(self._transitions)
+            tz = zonefile.get(key)
+            if tz is not None:
+                self._store(self._compute(key, tz, now))
+                refreshed += 1
+
+        return refreshed
+
+    def get(self, key: str, /) -> ZoneOffset | None:
+        _ = self.refresh()
+        return self._zones.get(key)
+
+    def at_offset(self, offset: datetime.timedelta, /) -> list[ZoneOffset]:
+        _ = self.refresh()
+        return [self._zones[key] for key in sorted(self._by_offset.get(offset, ()))]
+
+    def offsets(self) -> list[datetime.timedelta]:
+        _ = self.refresh()
+        return sorted(offset for offset, keys in self._by_offset.items() if keys)
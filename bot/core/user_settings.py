@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from typing import TYPE_CHECKING, Any, Iterable, TypedDict, cast
+
+import pymongo
+import redis.exceptions
+from discord.utils import MISSING
+
+from .utils import LRUCache
+
+if TYPE_CHECKING:
+    from .bot import Parrot
+
+logger = logging.getLogger(__name__)
+
+
+class UserSettings(TypedDict, total=False):
+    id: int
+    timezone: str | None
+
+
+class UserSettingsCache:
+    """Read-through, write-through cache in front of ``user_configurations``.
+
+    Writes are published on a Redis channel so that every other process drops its copy of the user.
+    """
+
+    INVALIDATION_CHANNEL = "parrot:user_settings:invalidate"
+
+    MAX_SIZE = 50_000
+    TTL = 60 * 60
+
+    # together with the index below, lookups are answered from the index alone
+    PROJECTION = {"_id": 0, "id": 1, "timezone": 1}
+    INDEX = [("id", pymongo.ASCENDING), ("timezone", pymongo.ASCENDING)]
+
+    RETRY_DELAY = 5
+
+    def __init__(self, bot: Parrot) -> None:
+        self.bot = bot
+        self.cache: LRUCache[int, UserSettings] = LRUCache(maxsize=self.MAX_SIZE, ttl=self.TTL)
+
+        # lets a process ignore its own invalidation messages
+        self.instance_id = uuid.uuid4().hex
+
+    @property
+    def collection(self):
+        return self.bot.user_configurations_collection
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return self.cache.stats
+
+    async def get(self, user_id: int, /) -> UserSettings:
+        settings: UserSettings = self.cache.get(user_id)
+        if settings is not MISSING:
+            return settings
+
+        data = await self.collection.find_one({"id": user_id}, self.PROJECTION)
+        settings = cast(UserSettings, data or {"id": user_id})
+        self.cache.set(user_id, settings)
+
+        return settings
+
+    async def get_many(self, user_ids: Iterable[int], /) -> dict[int, UserSettings]:
+        result: dict[int, UserSettings] = {}
+        missing: list[int] = []
+
+        for user_id in set(user_ids):
+            settings = self.cache.get(user_id)
+            if settings is MISSING:
+                missing.append(user_id)
+            else:
+                result[user_id] = settings
+
+        if not missing:
+            return result
+
+        async for data in self.collection.find({"id": {"$in": missing}}, self.PROJECTION):
+            result[data["id"]] = cast(UserSettings, data)
+
+        for user_id in missing:
+            settings = result.setdefault(user_id, UserSettings(id=user_id))
+            self.cache.set(user_id, settings)
+
+        return result
+
+    async def update(self, user_id: int, /, **fields: Any) -> UserSettings:
+        data = await self.collection.find_one_and_update(
+            {"id": user_id}, {"$set": fields}, projection=self.PROJECTION, upsert=True, return_document=pymongo.ReturnDocument.AFTER
+        )
+        settings = cast(UserSettings, data)
+        self.cache.set(user_id, settings)
+
+        await self.publish_invalidation(user_id)
+        return settings
+
+    async def ensure_indexes(self) -> None:
+        _ = await self.collection.create_index(self.INDEX)
+
+    def invalidate(self, user_id: int, /) -> None:
+        self.cache.pop(user_id)
+
+    async def publish_invalidation(self, user_id: int, /) -> None:
+        try:
+            _ = await self.bot.redis_client.publish(self.INVALIDATION_CHANNEL, f"{self.instance_id}:{user_id}")
+        except (OSError, redis.exceptions.ConnectionError):
+            logger.warning("Could not publish user settings invalidation for user_id=%s", user_id, exc_info=True)
+
+    async def listen(self) -> None:
+        while not self.bot.is_closed():
+            try:
+                async with self.bot.redis_client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+
+                        instance_id, _, user_id = str(message["data"]).partition(":")
+                        if instance_id != self.instance_id:
+                            self.invalidate(int(user_id))
+
+            except (OSError, redis.exceptions.ConnectionError):
+                # anything published while we were away is lost, so start over from a cold cache
+                logger.warning("User settings invalidation listener disconnected, retrying in %s seconds", self.RETRY_DELAY, exc_info=True)
+                self.cache.clear()
+                await asyncio.sleep(self.RETRY_DELAY)
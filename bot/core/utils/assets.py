@@ -23,6 +23,7 @@ class Paths(Enum):
     PYTHON_TAGS = ASSETS / "python_tags"
     DISCORD_FACTS = ASSETS / "discord_facts.json"
     QUOTES = ASSETS / "quotes.txt"
+    CLDR_TIMEZONES = ASSETS / "cldr_timezones.json"
 
 
 class Emoji(Enum):
@@ -1,81 +1,628 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import inspect
+import json
 import logging
 import pickle
+import time
+import uuid
+import zlib
+from collections import Counter, OrderedDict
+from contextlib import suppress
 from functools import wraps
-from typing import Any, Callable, Coroutine, ParamSpec, Protocol, TypeVar, cast
+from typing import Any, Callable, Coroutine, Generic, Hashable, Literal, ParamSpec, Protocol, TypeVar, cast
 
-from discord.utils import maybe_coroutine
+import redis.exceptions
+from discord.utils import MISSING, maybe_coroutine
 from redis.asyncio import Redis
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 ReturnType_co = TypeVar("ReturnType_co", covariant=True)
 P = ParamSpec("P")
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
 logger = logging.getLogger(__name__)
 
 CACHE_DB = 5
+# how often a process re-reads the generation of a namespace, in case it missed an invalidate_all
+GENERATION_RECHECK_INTERVAL = 30
+
+# first byte of every stored value
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded in-process LRU cache with an optional per-entry TTL and hit/miss counters.
+
+    ``maxweight`` additionally bounds the sum of the ``weight`` given to :meth:`set`, e.g. a size in bytes.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float | None = None, maxweight: int | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxweight = maxweight
+
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._weights: dict[K, int] = {}
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, count=False) is not MISSING
+
+    def _discard(self, key: K) -> tuple[float, V] | None:
+        self.weight -= self._weights.pop(key, 0)
+        return self._data.pop(key, None)
+
+    def get(self, key: K, default: Any = MISSING, *, count: bool = True) -> Any:
+        entry = self._data.get(key)
+        if entry is not None and (entry[0] == 0 or entry[0] > time.monotonic()):
+            self._data.move_to_end(key)
+            self.hits += count
+            return entry[1]
+
+        if entry is not None:
+            _ = self._discard(key)
+
+        self.misses += count
+        return default
+
+    def set(self, key: K, value: V, *, ttl: float | None = None, weight: int = 0) -> None:
+        if self.maxweight is not None and weight > self.maxweight:
+            # would evict everything else and still not fit
+            _ = self._discard(key)
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        _ = self._discard(key)
+        self._data[key] = (time.monotonic() + ttl if ttl else 0, value)
+        if weight:
+            self._weights[key] = weight
+            self.weight += weight
+
+        while len(self._data) > self.maxsize or (self.maxweight is not None and self.weight > self.maxweight):
+            _ = self._discard(next(iter(self._data)))
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        entry = self._discard(key)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._weights.clear()
+        self.weight = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        stats = {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+        if self.maxweight is not None:
+            stats |= {"weight": self.weight, "maxweight": self.maxweight}
+
+        return stats
+
+
+class CacheInvalidator:
+    """Keeps the in-process state of :func:`async_method_cache` consistent across processes.
+
+    An invalidation is published on a Redis channel, and every other process drops the key from its
+    local cache of the same function, or, for ``invalidate_all``, moves to the new generation of its keys.
+    While the subscription is down nothing can be trusted, so all local caches are cleared
+    and generations are read from Redis again.
+    """
+
+    CHANNEL = "parrot:cache:invalidate"
+    RETRY_DELAY = 5
+
+    def __init__(self) -> None:
+        # lets a process ignore its own invalidation messages
+        self.instance_id = uuid.uuid4().hex
+
+        self._caches: dict[str, LRUCache[str, Any]] = {}
+        # namespace -> current generation, part of every key of the namespace
+        self.generations: dict[str, int] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def register(self, namespace: str, cache: LRUCache[str, Any], /) -> None:
+        self._caches[namespace] = cache
+
+    def ensure_listening(self, client: Redis, /) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.listen(client), name="async-method-cache-invalidator")
+
+    async def close(self) -> None:
+        if self._task is not None:
+            _ = self._task.cancel()
+            _ = await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def drop(self, namespace: str, key: str | None, /, *, generation: int | None = None) -> None:
+        cache = self._caches.get(namespace)
+        if key is not None:
+            if cache is not None:
+                _ = cache.pop(key)
+            return
+
+        if generation is not None:
+            self.generations[namespace] = max(generation, self.generations.get(namespace, 0))
+        if cache is not None:
+            cache.clear()
+
+    async def publish(self, client: Redis, namespace: str, key: str | None, /, *, generation: int | None = None) -> None:
+        try:
+            _ = await client.publish(self.CHANNEL, json.dumps([self.instance_id, namespace, key, generation]))
+        except (OSError, redis.exceptions.ConnectionError):
+            logger.warning("Could not publish cache invalidation for namespace=%s key=%s", namespace, key, exc_info=True)
+
+    async def listen(self, client: Redis, /) -> None:
+        while True:
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+
+                        instance_id, namespace, key, generation = json.loads(message["data"])
+                        if instance_id != self.instance_id:
+                            self.drop(namespace, key, generation=generation)
+
+            except (OSError, redis.exceptions.ConnectionError):
+                logger.warning("Cache invalidation listener disconnected, retrying in %s seconds", self.RETRY_DELAY, exc_info=True)
+                for cache in self._caches.values():
+                    cache.clear()
+
+                self.generations.clear()
+                await asyncio.sleep(self.RETRY_DELAY)
+
+
+invalidator = CacheInvalidator()
+
+
+class Serializer(Protocol):
+    name: str
+
+    def dumps(self, obj: Any, /) -> bytes: ...
+    def loads(self, data: bytes, /) -> Any: ...
+
+
+class PickleSerializer:
+    """Any picklable value. Only safe between processes that run the same code, see ``version``."""
+
+    name = "pickle"
+
+    def dumps(self, obj: Any, /) -> bytes:
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes, /) -> Any:
+        return pickle.loads(data)
+
+
+class JSONSerializer:
+    """JSON values only, tuples come back as lists. Uses orjson when it is installed."""
+
+    name = "json"
+
+    def dumps(self, obj: Any, /) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: bytes, /) -> Any:
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+class MsgpackSerializer:
+    """msgpack values only, tuples come back as lists. Needs the ``msgpack`` package."""
+
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        # imported here so that only processes caching with msgpack need it, and fail when the cache is declared
+        try:
+            import msgpack  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise RuntimeError("serializer='msgpack' needs the msgpack package, install it with `pip install msgpack`") from None
+
+        self._msgpack = msgpack
+
+    def dumps(self, obj: Any, /) -> bytes:
+        return cast(bytes, self._msgpack.packb(obj, use_bin_type=True))
+
+    def loads(self, data: bytes, /) -> Any:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+SERIALIZERS: dict[str, Callable[[], Serializer]] = {"pickle": PickleSerializer, "json": JSONSerializer, "msgpack": MsgpackSerializer}
+
+# keyword arguments consumed by the wrapper itself
+_CONTROL_KWARGS = frozenset({"fetch_cache", "cache"})
+
+
+def stable_repr(value: Any, /) -> str:
+    """A string that is equal for equal arguments, in every process and across restarts.
+
+    Primitives and containers of them are written out directly, anything else falls back to a hash of its pickle.
+    """
+    # bool first, it is an int
+    if value is None or isinstance(value, bool):
+        return repr(value)
+    if isinstance(value, (int, float)):
+        return f"{type(value).__name__[0]}{value!r}"
+    if isinstance(value, str):
+        # length prefixed, so no string can pass for a separator
+        return f"s{len(value)}:{value}"
+    if isinstance(value, bytes):
+        return f"b{value.hex()}"
+    if isinstance(value, tuple):
+        return f"({','.join(map(stable_repr, value))})"
+    if isinstance(value, list):
+        return f"[{','.join(map(stable_repr, value))}]"
+    if isinstance(value, (set, frozenset)):
+        return f"{{{','.join(sorted(map(stable_repr, value)))}}}"
+    if isinstance(value, dict):
+        return f"{{{','.join(sorted(f'{stable_repr(k)}={stable_repr(v)}' for k, v in value.items()))}}}"
+
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return f"p{hashlib.blake2b(data, digest_size=16).hexdigest()}"
 
 
 class CacheProtocol(Protocol[ReturnType_co]):
     redis: Redis
+    local: LRUCache[str, tuple[float | None, Any]] | None
+    stats: Counter[str]
 
     async def __call__(*args: Any, **kwargs: Any) -> ReturnType_co: ...
     async def invalidate(*args: Any, **kwargs: Any) -> None: ...
+    async def invalidate_all(self) -> None: ...
 
     @property
     def __name__(self) -> str: ...
 
 
-def async_method_cache(*, expire: int | None = None, ignore_kwargs: bool = True) -> Callable[[Callable[P, Coroutine[Any, Any, ReturnType_co]]], CacheProtocol[ReturnType_co]]:
+def async_method_cache(
+    *,
+    expire: int | None = None,
+    ignore_kwargs: bool = True,
+    local: bool = False,
+    local_maxsize: int = 1024,
+    local_ttl: float | None = 60,
+    local_max_bytes: int | None = 16 * 1024 * 1024,
+    lock: bool = False,
+    lock_timeout: float = 10,
+    stale_ttl: int | None = None,
+    refresh_ahead: float | None = None,
+    refresh_min_hits: int = 10,
+    serializer: Literal["pickle", "json", "msgpack"] | Serializer = "pickle",
+    compress_threshold: int | None = 1024,
+    version: int | str = 0,
+) -> Callable[[Callable[P, Coroutine[Any, Any, ReturnType_co]]], CacheProtocol[ReturnType_co]]:
+    """Cache the results of a coroutine method in Redis.
+
+    With ``local=True`` results are also kept, already decoded, in a per-process LRU in front of Redis,
+    bounded by ``local_maxsize`` entries and ``local_max_bytes`` of encoded size. A local entry lives for at most
+    ``local_ttl`` seconds and never outlives its Redis key, and :meth:`invalidate` drops it in every process.
+    Callers then share the cached object, so it must not be mutated.
+
+    Concurrent misses of the same key in a process share a single call of the function (and its exception).
+    With ``lock=True`` a Redis lock extends that across processes: the others wait up to ``lock_timeout``
+    seconds for the holder to fill the key, then call the function themselves.
+
+    With ``stale_ttl`` an entry is kept that many seconds past ``expire``. A stale entry is still returned
+    immediately, while a background task calls the function and replaces it. With ``refresh_ahead`` a key that is
+    read ``refresh_min_hits`` times in the last ``refresh_ahead`` seconds before it expires is refreshed early,
+    so a hot key never goes stale at all.
+
+    Values are written with ``serializer`` and zlib compressed once they reach ``compress_threshold`` bytes.
+    ``version`` is part of the key: bump it whenever the return type changes, so a deploy never reads
+    values written by the old code.
+
+    Keys read ``cache:<module>:<qualname>:v<version>:<serializer>:<generation>:<hash of the arguments>``.
+    :meth:`invalidate_all` moves the function to a new generation, the old keys are left to expire,
+    so it needs an ``expire``. Processes learn about a new generation through Redis pub/sub and, should they
+    miss the message, by re-reading it every ``GENERATION_RECHECK_INTERVAL`` seconds.
+    """
+    if (stale_ttl or refresh_ahead) and not expire:
+        raise ValueError("stale_ttl and refresh_ahead need an expire")
+
     def decorator(func: Callable[P, Coroutine[Any, Any, ReturnType_co]]) -> CacheProtocol[ReturnType_co]:
-        redis = Redis(db=CACHE_DB, decode_responses=False, protocol=3)
+        client = Redis(db=CACHE_DB, decode_responses=False, protocol=3)
+        namespace = f"{func.__module__}:{func.__qualname__}"
+        stats: Counter[str] = Counter()
+        # lookups of missing keys, shared by every caller of the key
+        inflight: dict[str, asyncio.Task[ReturnType_co]] = {}
+        # background refreshes, nobody waits for these
+        refreshing: dict[str, asyncio.Task[ReturnType_co]] = {}
+        # reads of each key while it is about to expire
+        hot: LRUCache[str, int] = LRUCache(maxsize=4096)
+        # how long Redis keeps an entry, fresh or stale
+        redis_ttl = expire + stale_ttl if expire and stale_ttl else expire
+        codec = SERIALIZERS[serializer]() if isinstance(serializer, str) else serializer
+
+        # entries are ``(fresh until, result)``, the deadline is a wall clock time shared by every process
+        l1: LRUCache[str, tuple[float | None, Any]] | None = None
+        if local:
+            l1 = LRUCache(maxsize=local_maxsize, ttl=local_ttl, maxweight=local_max_bytes)
+            invalidator.register(namespace, l1)
+
+        prefix = f"cache:{namespace}:v{version}:{codec.name}:"
+        generation_key = f"cache:{namespace}:generation"
+        # everything after ``self``, in the order positional arguments fill them
+        positional = [
+            parameter.name
+            for parameter in list(inspect.signature(func).parameters.values())[1:]
+            if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+
+        generation_checked_at = 0.0
+
+        async def current_generation() -> int:
+            nonlocal generation_checked_at
+
+            generation = invalidator.generations.get(namespace)
+            now = time.monotonic()
+            if generation is None or now - generation_checked_at > GENERATION_RECHECK_INTERVAL:
+                generation_checked_at = now
+                stored = cast(bytes | None, await maybe_coroutine(client.get, generation_key))
+                # a newer generation may have been published while we were waiting
+                generation = invalidator.generations[namespace] = max(int(stored or 0), invalidator.generations.get(namespace, 0))
+
+            return generation
+
+        def make_key(args: tuple[Any, ...], kwargs: dict[str, Any], generation: int) -> str:
+            if kwargs:
+                kwargs = {name: value for name, value in kwargs.items() if name not in _CONTROL_KWARGS}
+
+            parts = list(args)
+            if kwargs:
+                # f(1) and f(x=1) are the same call
+                kwargs = dict(kwargs)
+                for name in positional[len(parts) :]:
+                    if name not in kwargs:
+                        break
+                    parts.append(kwargs.pop(name))
+
+            raw = stable_repr(tuple(parts))
+            if kwargs and not ignore_kwargs:
+                raw += stable_repr(kwargs)
+
+            return f"{prefix}{generation}:{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"
+
+        def encode(entry: tuple[float | None, Any]) -> bytes:
+            data = codec.dumps(entry)
+            if compress_threshold is not None and len(data) >= compress_threshold:
+                return _ZLIB + zlib.compress(data, 3)
+
+            return _RAW + data
+
+        def decode(data: bytes) -> tuple[float | None, Any]:
+            header, data = data[:1], data[1:]
+            if header == _ZLIB:
+                data = zlib.decompress(data)
+            elif header != _RAW:
+                raise ValueError(f"unknown cache value header {header!r}")
+
+            fresh_until, result = codec.loads(data)
+            return fresh_until, result
+
+        def usable(entry: tuple[float | None, Any]) -> bool:
+            # without a stale window an expired entry is a miss, even if Redis has not dropped it yet
+            fresh_until = entry[0]
+            return fresh_until is None or bool(stale_ttl) or fresh_until > time.time()
+
+        def remember(key: str, entry: tuple[float | None, Any], weight: int) -> None:
+            if l1 is None:
+                return
+
+            fresh_until = entry[0]
+            if fresh_until is None:
+                l1.set(key, entry, weight=weight)
+                return
 
-        def make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
-            raw = [func.__module__, func.__qualname__, args]
-            if not ignore_kwargs:
-                raw.append(tuple(sorted(kwargs.items())))
+            # never outlive the Redis key, however late in its life it was read
+            remaining = fresh_until + (stale_ttl or 0) - time.time()
+            if remaining > 0:
+                l1.set(key, entry, ttl=min(remaining, local_ttl or remaining), weight=weight)
 
-            data = pickle.dumps(raw, protocol=pickle.HIGHEST_PROTOCOL)
-            return hashlib.sha256(data).hexdigest()
+        async def fetch(key: str) -> Any:
+            data = await maybe_coroutine(client.get, key)
+            if not isinstance(data, bytes):
+                return MISSING
+
+            try:
+                entry = decode(data)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.warning("Unreadable cache value for func=`%s` key=%s, treating it as a miss", func.__name__, key, exc_info=True)
+                return MISSING
+
+            if not usable(entry):
+                return MISSING
+
+            remember(key, entry, len(data))
+            return entry
+
+        async def store(key: str, result: ReturnType_co) -> None:
+            entry = (time.time() + expire if expire else None, result)
+            data = encode(entry)
+            await client.set(key, data, redis_ttl)
+            remember(key, entry, len(data))
+
+            _ = hot.pop(key)
+
+        def serve(key: str, entry: tuple[float | None, Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+            fresh_until, result = entry
+            if fresh_until is None:
+                return result
+
+            remaining = fresh_until - time.time()
+            if remaining <= 0:
+                stats["stale"] += 1
+                schedule_refresh(key, args, kwargs)
+            elif refresh_ahead and remaining <= refresh_ahead:
+                hits = hot.get(key, 0, count=False) + 1
+                hot.set(key, hits)
+                if hits >= refresh_min_hits and schedule_refresh(key, args, kwargs):
+                    stats["refreshed_ahead"] += 1
+
+            return result
+
+        def track(tasks: dict[str, asyncio.Task[ReturnType_co]], key: str, coro: Coroutine[Any, Any, ReturnType_co]) -> asyncio.Task[ReturnType_co]:
+            task = tasks[key] = asyncio.create_task(coro)
+            task.add_done_callback(lambda _: tasks.pop(key, None))
+            return task
+
+        def schedule_refresh(key: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+            if key in refreshing:
+                return False
+
+            track(refreshing, key, refresh(key, args, kwargs)).add_done_callback(log_refresh_failure)
+            return True
+
+        def log_refresh_failure(task: asyncio.Task[ReturnType_co]) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.error("Background refresh of func=`%s` failed, serving the stale entry", func.__name__, exc_info=task.exception())
+
+        async def refresh(key: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> ReturnType_co:
+            redis_lock = client.lock(f"{key}:lock", timeout=lock_timeout) if lock else None
+            if redis_lock is not None and not await redis_lock.acquire(blocking=False):
+                # another process is already refreshing it
+                entry = await fetch(key)
+                if entry is not MISSING:
+                    return entry[1]
+
+                redis_lock = None
+
+            try:
+                stats["refreshes"] += 1
+                result = await func(*args, **kwargs)
+                await store(key, result)
+                return result
+            finally:
+                if redis_lock is not None:
+                    with suppress(redis.exceptions.LockError):
+                        await redis_lock.release()
+
+        async def fill(key: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> ReturnType_co:
+            entry = await fetch(key)
+            if entry is not MISSING:
+                stats["hits"] += 1
+                logger.debug("Cache hit for func=`%s` key=%s", func.__name__, key)
+                return serve(key, entry, args, kwargs)
+
+            logger.debug("Cache miss for func=`%s` key=%s. Executing function.", func.__name__, key)
+            if not lock:
+                stats["misses"] += 1
+                result = await func(*args, **kwargs)
+                await store(key, result)
+                return result
+
+            redis_lock = client.lock(f"{key}:lock", timeout=lock_timeout, blocking_timeout=lock_timeout)
+            acquired = await redis_lock.acquire()
+            try:
+                if not acquired:
+                    stats["lock_timeouts"] += 1
+                    logger.warning("Timed out waiting for the cache lock of func=`%s`, calling it anyway", func.__name__)
+
+                # the previous holder has most likely filled the key by now
+                entry = await fetch(key)
+                if entry is not MISSING:
+                    stats["coalesced_remote"] += 1
+                    return serve(key, entry, args, kwargs)
+
+                stats["misses"] += 1
+                result = await func(*args, **kwargs)
+                await store(key, result)
+                return result
+            finally:
+                if acquired:
+                    with suppress(redis.exceptions.LockError):
+                        await redis_lock.release()
 
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> ReturnType_co:
             fetch_cache = kwargs.pop("fetch_cache", True)
             cache = kwargs.pop("cache", True)
 
-            key = make_key(args[1:], kwargs)
+            invalidator.ensure_listening(client)
+            key = make_key(args[1:], kwargs, await current_generation())
+            stats["calls"] += 1
 
             logger.debug("Checking cache for func=`%s` args=%s kwargs=%s", func.__name__, args[1:], kwargs if not ignore_kwargs else {})
 
-            if fetch_cache:
-                data = await maybe_coroutine(redis.get, key)
-                if isinstance(data, bytes):
-                    result = pickle.loads(data)
-                    logger.debug("Cache hit for func=`%s` args=%s kwargs=%s", func.__name__, args[1:], kwargs if not ignore_kwargs else {})
-                    return result
-            else:
-                logger.warning("Fetch_Cache=False for func=`%s` args=%s kwargs=%s. Bypassing cache.", func.__name__, args[1:], kwargs if not ignore_kwargs else {})
+            if not fetch_cache or not cache:
+                if not fetch_cache:
+                    logger.warning("Fetch_Cache=False for func=`%s` args=%s kwargs=%s. Bypassing cache.", func.__name__, args[1:], kwargs if not ignore_kwargs else {})
+                else:
+                    entry = await fetch(key)
+                    if entry is not MISSING:
+                        stats["hits"] += 1
+                        return serve(key, entry, args, kwargs)
 
-            logger.debug("Cache miss for func=`%s` args=%s kwargs=%s. Executing function.", func.__name__, args[1:], kwargs if not ignore_kwargs else {})
-            result = await func(*args, **kwargs)
+                stats["misses"] += 1
+                result = await func(*args, **kwargs)
+                if cache:
+                    await store(key, result)
+                else:
+                    logger.warning("Caching=False for func=`%s` args=%s kwargs=%s. Not caching result.", func.__name__, args[1:], kwargs if not ignore_kwargs else {})
 
-            if cache:
-                await redis.set(key, pickle.dumps(result), expire)
+                return result
+
+            if l1 is not None:
+                entry = l1.get(key)
+                if entry is not MISSING and not usable(entry):
+                    _ = l1.pop(key)
+                    entry = MISSING
+                if entry is not MISSING:
+                    stats["local_hits"] += 1
+                    return serve(key, entry, args, kwargs)
+
+            task = inflight.get(key)
+            if task is None:
+                task = track(inflight, key, fill(key, args, kwargs))
             else:
-                logger.warning("Caching=False for func=`%s` args=%s kwargs=%s. Not caching result.", func.__name__, args[1:], kwargs if not ignore_kwargs else {})
+                stats["coalesced"] += 1
 
-            return result
+            # a cancelled caller must not cancel the call the others are waiting on
+            return await asyncio.shield(task)
 
         async def invalidate(*args: P.args, **kwargs: P.kwargs) -> None:
-            key = make_key(args, kwargs)
+            key = make_key(args, kwargs, await current_generation())
+
+            await client.delete(key)
+            if l1 is not None:
+                _ = l1.pop(key)
+                await invalidator.publish(client, namespace, key)
 
-            await redis.delete(key)
             logger.debug("Cache invalidated for func=`%s` args=%s kwargs=%s", func.__name__, args, kwargs if not ignore_kwargs else {})
 
+        async def invalidate_all() -> None:
+            if not expire:
+                raise ValueError(f"{func.__qualname__} has no expire, invalidate_all would leave its old keys in Redis forever")
+
+            generation = await client.incr(generation_key)
+            invalidator.drop(namespace, None, generation=generation)
+            await invalidator.publish(client, namespace, None, generation=generation)
+
+            logger.debug("Cache invalidated for func=`%s`, now at generation %s", func.__name__, generation)
+
         setattr(wrapper, "invalidate", invalidate)
+        setattr(wrapper, "invalidate_all", invalidate_all)
         setattr(wrapper, "__name__", func.__name__)
-        setattr(wrapper, "redis", redis)
+        setattr(wrapper, "redis", client)
+        setattr(wrapper, "local", l1)
+        setattr(wrapper, "stats", stats)
 
         return cast(CacheProtocol[ReturnType_co], wrapper)
 
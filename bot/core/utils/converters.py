@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, NamedTuple
+import re
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 import discord
+from discord import app_commands
 from discord.ext import commands  # pylint: disable=reimported
 
 if TYPE_CHECKING:
@@ -23,10 +25,49 @@ def convert_bool(text: str) -> bool:
     raise commands.BadBoolArgument(lowered)
 
 
+class MemberConverter(commands.MemberConverter):  # pylint: disable=too-few-public-methods
+    """Resolves only the requested member through the bot's member resolver, so the guild never has to be chunked."""
+
+    async def convert(self, ctx: Context[Parrot], argument: str) -> discord.Member:
+        if ctx.guild is None:  # pyright: ignore[reportUnnecessaryComparison]
+            return await super().convert(ctx, argument)
+
+        match = self._get_id_match(argument) or re.match(r"<@!?([0-9]{15,20})>$", argument)
+        if match is not None:
+            member = await ctx.bot.member_resolver.fetch(ctx.guild, int(match.group(1)))
+            if member is None:
+                raise commands.MemberNotFound(argument)
+            return member
+
+        username, _, discriminator = argument.rpartition("#")
+        if not username or not discriminator.isdigit() or len(discriminator) != 4:
+            username, discriminator = argument, None
+
+        resolver = ctx.bot.member_resolver
+        member = self._pick(resolver.index.lookup(ctx.guild, username), username, discriminator)
+        if member is None:
+            # search results are added to the index as they arrive
+            _ = await resolver.search(ctx.guild, username)
+            member = self._pick(resolver.index.lookup(ctx.guild, username), username, discriminator)
+
+        if member is None:
+            raise commands.MemberNotFound(argument)
+
+        return member
+
+    @staticmethod
+    def _pick(members: list[discord.Member], name: str, discriminator: str | None) -> discord.Member | None:
+        if discriminator is not None:
+            return discord.utils.get(members, name=name, discriminator=discriminator)
+
+        # prefer an exact match over a case-insensitive one
+        return discord.utils.find(lambda m: name in (m.name, m.global_name, m.nick), members) or next(iter(members), None)
+
+
 class UserID(commands.Converter):  # pylint: disable=too-few-public-methods
     async def convert(self, ctx: Context[Parrot], argument: str) -> discord.abc.Snowflake:
         try:
-            member = await commands.MemberConverter().convert(ctx, argument)
+            member = await MemberConverter().convert(ctx, argument)
         except commands.BadArgument:
             member_id = int(argument, base=10)
             member = ctx.bot.get_user(member_id) or await ctx.bot.fetch_user(member_id)
@@ -90,6 +131,32 @@ class TimeZone(NamedTuple):
             raise commands.BadArgument(f"Could not find timezone for {argument!r}") from e
 
 
+class TimeZoneTransformer(app_commands.Transformer, commands.Converter):
+    """:class:`TimeZone` for hybrid and slash commands, with autocomplete from the bot's timezone index."""
+
+    async def convert(self, ctx: Context[Parrot], argument: str) -> TimeZone:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return await TimeZone.convert(ctx, argument)
+
+    async def transform(self, interaction: discord.Interaction[discord.Client], value: str, /) -> TimeZone:
+        bot = cast("Parrot", interaction.client)
+        # autocomplete hands back the zone key, anything typed by hand takes the best match
+        if value in bot.valid_timezones:
+            return TimeZone(key=value, label=value)
+
+        timezones = bot.find_timezones(value, limit=1)
+        if not timezones:
+            raise app_commands.AppCommandError(f"Could not find timezone for {value!r}")
+
+        return timezones[0]
+
+    async def autocomplete(self, interaction: discord.Interaction[discord.Client], value: int | float | str, /) -> list[app_commands.Choice[int | float | str]]:
+        bot = cast("Parrot", interaction.client)
+        return [
+            app_commands.Choice(name=(timezone.label if timezone.label == timezone.key else f"{timezone.label} ({timezone.key})")[:100], value=timezone.key)
+            for timezone in bot.timezone_index.search(str(value))
+        ]
+
+
 class WrappedMessageConverter(commands.MessageConverter):  # pylint: disable=too-few-public-methods
     async def convert(self, ctx: Context[Parrot], argument: str) -> discord.Message:
         if argument.startswith("[") and argument.endswith("]"):
@@ -97,4 +164,19 @@ class WrappedMessageConverter(commands.MessageConverter):  # pylint: disable=too
         if argument.startswith("<") and argument.endswith(">"):
             argument = argument[1:-1]
 
-        return await super().convert(ctx, argument)
+        # discord.py's MessageConverter resolves the id through these as well
+        partial = commands.PartialMessageConverter
+        guild_id, message_id, channel_id = partial._get_id_matches(ctx, argument)  # pyright: ignore[reportPrivateUsage] # pylint: disable=protected-access
+        channel = partial._resolve_channel(ctx, guild_id, channel_id)  # pyright: ignore[reportPrivateUsage] # pylint: disable=protected-access
+        if channel is None or not isinstance(channel, discord.abc.Messageable):
+            raise commands.ChannelNotFound(str(channel_id))
+
+        try:
+            message = await ctx.bot.get_or_fetch_message(channel, message_id)
+        except discord.Forbidden:
+            raise commands.ChannelNotReadable(channel) from None  # type: ignore[arg-type]
+
+        if message is None:
+            raise commands.MessageNotFound(argument)
+
+        return message
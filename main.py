@@ -1,17 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-import logging
 import os
 from contextlib import suppress
 
 import uvicorn
 from dotenv import load_dotenv
-from rich.console import Console
-from rich.logging import RichHandler
 from rich.traceback import install as rich_tracebacks
 
 from bot import Parrot
+from bot.core.cluster import ClusterLauncher
+from bot.core.logs import setup_logging
 
 with suppress(ImportError):
     import uvloop
@@ -19,12 +18,8 @@ with suppress(ImportError):
     uvloop.install()
 
 
-file = open("parrot.log", "a", encoding="utf-8")  # type: ignore[resource-leak] # pylint: disable=consider-using-with
-console = Console(file=file)
-
-logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[RichHandler(rich_tracebacks=True, console=console)])
-
-LOGGING_CONFIG: dict[str, object] = {"version": 1, "disable_existing_loggers": False, "handlers": {"custom": {"()": RichHandler}}}
+# no handlers of its own, uvicorn's records propagate to the queue handler on the root logger
+LOGGING_CONFIG: dict[str, object] = {"version": 1, "disable_existing_loggers": False}
 
 with open("version.txt", encoding="utf-8") as version_file:
     version = version_file.read().strip()
@@ -37,9 +32,9 @@ def uvicorn_server(app, port: int) -> uvicorn.Server:
 VERSION = version
 
 
-async def main() -> None:
+async def main(shard_count: int | None = None) -> None:
     _ = load_dotenv(verbose=True)
-    parrot = Parrot(version=VERSION)
+    parrot = Parrot(version=VERSION, shard_count=shard_count)
 
     await parrot.start(os.environ["DISCORD_BOT_TOKEN"])
 
@@ -47,4 +42,13 @@ async def main() -> None:
 if __name__ == "__main__":
     rich_tracebacks()
 
-    asyncio.run(main())
+    _ = load_dotenv(verbose=True)
+    _ = setup_logging()
+    # more than one cluster runs each range of shards in its own process
+    CLUSTER_COUNT = int(os.environ.get("CLUSTER_COUNT", 1))
+    SHARD_COUNT = int(os.environ["SHARD_COUNT"]) if "SHARD_COUNT" in os.environ else None
+
+    if CLUSTER_COUNT > 1:
+        ClusterLauncher(version=VERSION, cluster_count=CLUSTER_COUNT, shard_count=SHARD_COUNT).run()
+    else:
+        asyncio.run(main(shard_count=SHARD_COUNT))
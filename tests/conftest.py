@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from typing import Any, Callable
+
+import arrow
+import discord
+import pytest
+from bson import ObjectId
+from discord.ext import commands
+
+from bot.core.bot import Parrot
+from bot.core.timers import TimerConfig
+
+
+class FakeRedis:
+    def register_script(self, script: str) -> None:
+        return None
+
+
+class FakeBot(commands.Bot):
+    """Just enough of :class:`Parrot` for the timer code, dispatching through discord.py's own events."""
+
+    call_timer = Parrot.call_timer
+
+    def __init__(self) -> None:
+        super().__init__(command_prefix="!", intents=discord.Intents.none())
+        self.closed = False
+        self.cluster_id = 1
+        self.redis_client = FakeRedis()
+        self.timer_collection: Any = None
+
+        self.dispatched: asyncio.Queue[tuple[str, TimerConfig]] = asyncio.Queue()
+        self.errors: list[str] = []
+
+        # set by login on a real bot, tests that only drive the timing wheel run without a loop
+        with suppress(RuntimeError):
+            self.loop = asyncio.get_running_loop()
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def dispatch(self, event_name: str, /, *args: Any, **kwargs: Any) -> None:
+        self.dispatched.put_nowait((event_name, *args))
+        super().dispatch(event_name, *args, **kwargs)
+
+    async def wait_until_ready(self) -> None:
+        return None
+
+    async def get_timezones(self, user_ids: Any) -> dict[int, str | None]:
+        return {}
+
+    async def on_error(self, event_method: str, /, *args: Any, **kwargs: Any) -> None:
+        self.errors.append(event_method)
+
+
+@pytest.fixture
+def make_bot() -> Callable[[], FakeBot]:
+    """Bots are made inside the test's event loop, which discord.py binds them to."""
+    return FakeBot
+
+
+@pytest.fixture
+def make_timer() -> Callable[..., TimerConfig]:
+    def make(delay: float = 0, **metadata: Any) -> TimerConfig:
+        now = arrow.utcnow()
+        return {"_id": ObjectId(), "event_name": "test_timer", "created_at": now.datetime, "due_date": now.shift(seconds=delay).datetime, "metadata": metadata}
+
+    return make
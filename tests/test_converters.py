@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import discord
+
+from bot.core.utils.converters import WrappedMessageConverter
+
+GUILD_ID = 336642139381301249
+CHANNEL_ID = 381965515721146390
+MESSAGE_ID = 1085653946187960370
+
+
+class FakeChannel(discord.abc.Messageable):
+    def __init__(self, channel_id: int) -> None:
+        self.id = channel_id
+
+
+class FakeGuild:
+    def __init__(self, channel: FakeChannel) -> None:
+        self.id = GUILD_ID
+        self.channel = channel
+
+    def _resolve_channel(self, channel_id: int) -> FakeChannel | None:
+        return self.channel if channel_id == self.channel.id else None
+
+
+class FakeBot:
+    def __init__(self, guild: FakeGuild) -> None:
+        self.guild = guild
+        self.fetched: list[tuple[FakeChannel, int]] = []
+
+    def get_guild(self, guild_id: int) -> FakeGuild | None:
+        return self.guild if guild_id == self.guild.id else None
+
+    def get_channel(self, channel_id: int) -> FakeChannel | None:
+        return self.guild._resolve_channel(channel_id)
+
+    async def get_or_fetch_message(self, channel: FakeChannel, message_id: int) -> Any:
+        self.fetched.append((channel, message_id))
+        return SimpleNamespace(id=message_id, channel=channel)
+
+
+def make_context() -> Any:
+    channel = FakeChannel(CHANNEL_ID)
+    guild = FakeGuild(channel)
+    return SimpleNamespace(bot=FakeBot(guild), guild=guild, channel=channel)
+
+
+def test_converts_message_link() -> None:
+    ctx = make_context()
+    link = f"<https://discord.com/channels/{GUILD_ID}/{CHANNEL_ID}/{MESSAGE_ID}>"
+
+    message = asyncio.run(WrappedMessageConverter().convert(ctx, link))
+
+    assert message.id == MESSAGE_ID
+    assert ctx.bot.fetched == [(ctx.channel, MESSAGE_ID)]
+
+
+def test_converts_bare_message_id() -> None:
+    ctx = make_context()
+
+    message = asyncio.run(WrappedMessageConverter().convert(ctx, str(MESSAGE_ID)))
+
+    assert message.id == MESSAGE_ID
+    assert message.channel is ctx.channel
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable
+
+import arrow
+
+from bot.core.timers import RedisTimerScheduler, TimerConfig
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeBot
+
+
+class FakeScheduler(RedisTimerScheduler):
+    def __init__(self, bot: Any, timers: list[TimerConfig]) -> None:
+        super().__init__(bot)
+        self.pending = timers
+        self.acked: asyncio.Queue[str] = asyncio.Queue()
+
+    async def claim(self, limit: int) -> list[TimerConfig]:
+        timers, self.pending = self.pending[:limit], self.pending[limit:]
+        return timers
+
+    async def ack(self, timer: TimerConfig) -> None:
+        self.acked.put_nowait(timer["metadata"]["name"])
+
+    async def prefetch_user_settings(self, timers: list[TimerConfig]) -> None:
+        return None
+
+    async def _next_due(self) -> float:
+        return arrow.utcnow().timestamp() + 0.05
+
+
+def make_scheduler(bot: FakeBot, timers: list[TimerConfig]) -> FakeScheduler:
+    scheduler = FakeScheduler(bot, timers)
+    bot.timer_scheduler = scheduler  # type: ignore[attr-defined]
+    return scheduler
+
+
+def test_slow_listener_does_not_hold_up_other_timers(make_bot: Callable[[], FakeBot], make_timer: Callable[..., TimerConfig]) -> None:
+    async def main() -> list[str]:
+        bot = make_bot()
+        release = asyncio.Event()
+
+        async def on_test_timer(timer: TimerConfig) -> None:
+            if timer["metadata"]["name"] == "slow":
+                await release.wait()
+
+        bot.add_listener(on_test_timer)
+        scheduler = make_scheduler(bot, [make_timer(name="slow"), make_timer(name="fast")])
+        task = asyncio.create_task(scheduler.run())
+        try:
+            first = await asyncio.wait_for(scheduler.acked.get(), timeout=1)
+            scheduler.pending.append(make_timer(name="later"))
+            second = await asyncio.wait_for(scheduler.acked.get(), timeout=1)
+
+            release.set()
+            third = await asyncio.wait_for(scheduler.acked.get(), timeout=1)
+            return [first, second, third]
+        finally:
+            bot.closed = True
+            _ = task.cancel()
+            await scheduler.close()
+
+    assert asyncio.run(main()) == ["fast", "later", "slow"]
+
+
+def test_listener_errors_go_to_on_error_and_timer_is_acked(make_bot: Callable[[], FakeBot], make_timer: Callable[..., TimerConfig]) -> None:
+    async def main() -> tuple[str, list[str]]:
+        bot = make_bot()
+
+        async def on_test_timer(timer: TimerConfig) -> None:
+            raise RuntimeError("listener failed")
+
+        bot.add_listener(on_test_timer)
+        scheduler = make_scheduler(bot, [])
+        await scheduler.dispatch(make_timer(name="broken"))
+        return await asyncio.wait_for(scheduler.acked.get(), timeout=1), bot.errors
+
+    assert asyncio.run(main()) == ("broken", ["on_test_timer"])
+
+
+def test_fired_timers_reach_wait_for(make_bot: Callable[[], FakeBot], make_timer: Callable[..., TimerConfig]) -> None:
+    async def main() -> TimerConfig:
+        bot = make_bot()
+        scheduler = make_scheduler(bot, [make_timer(name="waited")])
+        waiter = asyncio.create_task(bot.wait_for("test_timer", timeout=1))
+        task = asyncio.create_task(scheduler.run())
+        try:
+            return await waiter
+        finally:
+            bot.closed = True
+            _ = task.cancel()
+            await scheduler.close()
+
+    assert asyncio.run(main())["metadata"]["name"] == "waited"
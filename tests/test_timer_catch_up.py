@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable
+
+from bot.core.timers import TimerConfig, TimerScheduler, get_timer_id
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeBot
+
+
+class FakeCollection:
+    def __init__(self, timers: list[TimerConfig]) -> None:
+        self.timers = {timer.get("_id"): timer for timer in timers}
+
+    def find(self, *args: Any, **kwargs: Any) -> Any:
+        async def to_list(length: int | None = None) -> list[TimerConfig]:
+            return list(self.timers.values())
+
+        return SimpleNamespace(to_list=to_list)
+
+    async def update_many(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    async def delete_many(self, query: dict[str, Any]) -> None:
+        for timer_id in query["_id"]["$in"]:
+            _ = self.timers.pop(timer_id, None)
+
+    async def delete_one(self, query: dict[str, Any]) -> Any:
+        return SimpleNamespace(deleted_count=int(self.timers.pop(query["_id"], None) is not None))
+
+
+def test_timer_cancelled_during_catch_up_is_not_dispatched(make_bot: Callable[[], FakeBot], make_timer: Callable[..., TimerConfig]) -> None:
+    async def main() -> tuple[list[TimerConfig], TimerConfig, TimerConfig]:
+        first, second = make_timer(delay=-300, channel_id=1), make_timer(delay=-300, channel_id=1)
+        bot = make_bot()
+        bot.timer_collection = FakeCollection([first, second])
+        scheduler = TimerScheduler(bot)  # type: ignore[arg-type]
+        scheduler.CATCH_UP_CHANNEL_INTERVAL = 0.2  # pyright: ignore[reportAttributeAccessIssue]
+
+        assert await scheduler.catch_up() == 2
+        # the second timer of the channel waits for the first one's interval
+        dispatched = [(await asyncio.wait_for(bot.dispatched.get(), timeout=1))[1]]
+        assert await scheduler.remove(get_timer_id(second))
+
+        await asyncio.gather(*scheduler._catch_up_tasks)  # pyright: ignore[reportPrivateUsage]
+        while not bot.dispatched.empty():
+            dispatched.append(bot.dispatched.get_nowait()[1])
+
+        return dispatched, first, second
+
+    dispatched, first, _ = asyncio.run(main())
+    assert dispatched == [first]
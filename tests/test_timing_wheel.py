@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Callable
+
+from bot.core.timers import TimerConfig, TimingWheel
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeBot
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def turn_until_due(wheel: TimingWheel, clock: FakeClock, *, limit: int) -> float | None:
+    """Turn the wheel one tick at a time, like its driver does. Returns when the first timer came due."""
+    start = clock()
+    for _ in range(limit):
+        clock.advance(wheel.TICK)
+        if wheel._turn():  # pyright: ignore[reportPrivateUsage]
+            return clock() - start
+
+    return None
+
+
+def test_idle_wheel_fires_timer_after_stalled_wakeup(make_bot: Callable[[], FakeBot], make_timer: Callable[..., TimerConfig]) -> None:
+    # the wheel resyncs its tick when woken up from idle, a loop stall between scheduling and that
+    # resync used to move it past the timer's tick and the timer waited a whole revolution
+    clock = FakeClock()
+    wheel = TimingWheel(make_bot(), clock=clock)  # type: ignore[arg-type]
+    clock.advance(wheel.TICK * 2)
+
+    timer = make_timer()
+    _ = wheel.schedule(timer)
+    clock.advance(0.6)
+    wheel._resync()  # pyright: ignore[reportPrivateUsage]
+
+    assert wheel._turn() == [timer]  # pyright: ignore[reportPrivateUsage]
+
+
+def test_idle_wheel_resyncs_without_firing_early(make_bot: Callable[[], FakeBot], make_timer: Callable[..., TimerConfig]) -> None:
+    clock = FakeClock()
+    wheel = TimingWheel(make_bot(), clock=clock)  # type: ignore[arg-type]
+    clock.advance(wheel.TICK * 4)
+
+    _ = wheel.schedule(make_timer(delay=0.5))
+    wheel._resync()  # pyright: ignore[reportPrivateUsage]
+
+    fired_after = turn_until_due(wheel, clock, limit=8)
+    assert fired_after is not None
+    assert 0.5 <= fired_after < 0.5 + wheel.TICK
+
+
+def test_driver_dispatches_due_timers(make_bot: Callable[[], FakeBot], make_timer: Callable[..., TimerConfig]) -> None:
+    async def main() -> tuple[str, TimerConfig]:
+        bot = make_bot()
+        wheel = TimingWheel(bot)  # type: ignore[arg-type]
+        task = asyncio.create_task(wheel.run())
+        try:
+            _ = wheel.schedule(make_timer())
+            # generous, this only checks that the driver wakes up and dispatches
+            return await asyncio.wait_for(bot.dispatched.get(), timeout=5)
+        finally:
+            bot.closed = True
+            _ = task.cancel()
+
+    event_name, _ = asyncio.run(main())
+    assert event_name == "test_timer"